@@ -16,7 +16,10 @@ message shapes and key options, including:
 It also tests the following features:
 7. Search and Chat examples
 
-Each example sends a real POST request.
+Each add example builds its payload; the runner sends them as real requests.
+The add/search examples run concurrently over one shared `httpx.AsyncClient`
+and the interactive chat runs last. With MEMOS_EXAMPLES_BATCH_ADD=1, add payloads
+submitted together are grouped into `/product/add_batch` calls instead.
 
 NOTE:
 - This script assumes your MemOS server is running and router is mounted at `/product`.
@@ -25,9 +28,59 @@ NOTE:
 - If you want to test simple_struct memreader, you can go to examples/mem_reader/run_simple.py
 """
 
-import json
+import asyncio
+import contextlib
+import functools
+import importlib.util
+import os
+import sys
 
-import requests
+from collections import defaultdict
+
+import httpx
+
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+
+# Pick the fastest JSON library available: orjson > ujson > stdlib json. All of them
+# emit raw UTF-8, so Chinese text stays readable instead of being escaped.
+try:
+    import orjson
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def json_dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        def json_dumps(obj) -> bytes:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+
+        def json_dumps_pretty(obj) -> str:
+            return ujson.dumps(obj, indent=2, ensure_ascii=False, escape_forward_slashes=False)
+
+        json_loads = ujson.loads
+    except ImportError:
+        import json
+
+        def json_dumps(obj) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+        def json_dumps_pretty(obj) -> str:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+
+        json_loads = json.loads
 
 
 # ---------------------------------------------------------------------------
@@ -35,41 +88,294 @@ import requests
 # ---------------------------------------------------------------------------
 
 BASE_URL = "http://127.0.0.1:8001/product"
-HEADERS = {"Content-Type": "application/json"}
+# Bodies are always UTF-8 bytes; non-ASCII text is written as-is, not escaped.
+HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+# Endpoint URLs are parsed once here instead of on every request.
+ADD_URL = httpx.URL(f"{BASE_URL}/add")
+ADD_BATCH_URL = httpx.URL(f"{BASE_URL}/add_batch")
+SEARCH_URL = httpx.URL(f"{BASE_URL}/search")
+CHAT_COMPLETE_URL = httpx.URL(f"{BASE_URL}/chat/complete")
 
 # You can change these identifiers if your backend requires pre-registered users/cubes.
 USER_ID = "demo_add_user_001"
 MEM_CUBE_ID = "demo_add_cube_001"
 SESSION_ID = "demo_add_session_001"
 
+# Fields shared by every add payload; examples extend it with `BASE_PAYLOAD | {...}`.
+BASE_PAYLOAD = {"user_id": USER_ID, "writable_cube_ids": [MEM_CUBE_ID]}
+
+# Static messages are built (and their embedded JSON strings serialized) once at import.
+WEATHER_TOOL_ARGUMENTS = json_dumps({"location": "北京"}).decode()
+
+# Assistant tool-call message reused by the tool / function-calling examples.
+WEATHER_TOOL_CALL_MESSAGE = {
+    "role": "assistant",
+    "content": None,
+    "tool_calls": [
+        {
+            "id": "tool-call-weather-1",
+            "type": "function",
+            "function": {
+                "name": "get_weather",
+                "arguments": WEATHER_TOOL_ARGUMENTS,
+            },
+        }
+    ],
+    "chat_time": "2025-11-24T10:12:00Z",
+    "message_id": "assistant-with-call-1",
+}
+
+# Multimodal user message (text + image_url) used by the multimodal example.
+MULTIMODAL_TEXT_IMAGE_MESSAGE = {
+    "role": "user",
+    "content": [
+        {
+            "type": "text",
+            "text": "帮我看看这张图片大概是什么内容？",
+        },
+        {
+            "type": "image_url",
+            "image_url": {
+                "url": "https://example.com/mountain_lake.jpg",
+                "detail": "high",
+            },
+        },
+    ],
+    "chat_time": "2025-11-24T10:20:00Z",
+    "message_id": "mm-img-1",
+}
+
+# Set MEMOS_EXAMPLES_VERBOSE=1 to also echo every request payload (pretty-printed).
+VERBOSE = os.getenv("MEMOS_EXAMPLES_VERBOSE") == "1"
+# Set MEMOS_EXAMPLES_QUIET=1 to only write one "<name> <status>" line per example.
+QUIET = os.getenv("MEMOS_EXAMPLES_QUIET") == "1"
+
+# Set MEMOS_EXAMPLES_MSGPACK=1 to send request bodies as MessagePack (needs `msgpack`).
+# Bodies carrying base64 files/images shrink noticeably, but the server must accept
+# `Content-Type: application/msgpack`; the default router only parses JSON.
+USE_MSGPACK = os.getenv("MEMOS_EXAMPLES_MSGPACK") == "1"
+if USE_MSGPACK:
+    import msgpack
+
+# Set MEMOS_EXAMPLES_VALIDATE=1 to check each add payload against `APIADDRequest`
+# locally (needs the `memos` package), so a malformed example fails before any request.
+VALIDATE = os.getenv("MEMOS_EXAMPLES_VALIDATE") == "1"
+if VALIDATE:
+    from memos.api.product_models import APIADDRequest
+
+# Set MEMOS_EXAMPLES_BATCH_ADD=1 to group concurrent add examples into /product/add_batch
+# requests. The server reports each payload's result separately, but if the batch request
+# itself fails (e.g. a connection error), every payload in it is reported as failed.
+BATCH_ADD = os.getenv("MEMOS_EXAMPLES_BATCH_ADD") == "1"
+
+_BAR = "=" * 80
+
+# Upper bound on examples in flight at once, so the dev server is not flooded.
+MAX_CONCURRENT_EXAMPLES = 8
+
+# HTTP/2 multiplexes all examples over a single connection. It needs the optional
+# `h2` package (`pip install httpx[http2]`) and is negotiated via TLS ALPN, so a plain
+# http:// BASE_URL keeps using pooled HTTP/1.1 keep-alive connections.
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+CLIENT_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=30)
+
+
+def encode_body(payload: dict) -> tuple[bytes, dict]:
+    """Encode a request body and return it with the matching Content-Type header."""
+    if USE_MSGPACK:
+        return msgpack.packb(payload, use_bin_type=True), {"Content-Type": "application/msgpack"}
+    return json_dumps(payload), HEADERS
+
+
+# Responses worth retrying; any other status (including 4xx) is returned as-is.
+TRANSIENT_STATUS_CODES = {502, 503, 504}
+
+
+@retry(
+    retry=(
+        retry_if_exception_type(httpx.TransportError)
+        | retry_if_result(lambda resp: resp.status_code in TRANSIENT_STATUS_CODES)
+    ),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.1),
+    # Once attempts run out, hand back the last response (or re-raise the last error).
+    retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+)
+async def post_with_retry(
+    client: httpx.AsyncClient, url: httpx.URL, body: bytes, headers: dict
+) -> httpx.Response:
+    """POST a body, retrying connection errors, timeouts and 502/503/504 with backoff."""
+    return await client.post(url, content=body, headers=headers)
+
+
+def print_example(
+    name: str, payload: dict, status: int | None, detail: str, body_size: int | None = None
+):
+    """
+    Print the log block of one example.
+
+    The payload is only echoed when VERBOSE is set, since pretty-printing the
+    larger multi-turn payloads costs more than the request itself. In QUIET mode
+    only a single buffered "<name> <status>" line is written.
+
+    Args:
+        name: Logical name of this example.
+        payload: JSON payload that was sent.
+        status: HTTP status code, or None if the request failed.
+        detail: Response body, or the exception repr when the request failed.
+        body_size: Size in bytes of the encoded request body, shown in the header line.
+    """
+    if QUIET:
+        sys.stdout.write(f"{name} {status if status is not None else 'failed'}\n")
+        return
+
+    print(_BAR)
+    print(f"[*] Example: {name}" + (f" ({body_size} bytes)" if body_size is not None else ""))
+    if VERBOSE:
+        print("- Payload:")
+        print(json_dumps_pretty(payload))
+    if status is None:
+        print(f"- Request failed with exception: {detail}")
+    else:
+        print("- Response:")
+        print(status, detail)
+    print(_BAR)
+    print()
+
 
-def call_add_api(name: str, payload: dict):
+class AddBatcher:
+    """
+    Client-side micro-batcher for /product/add.
+
+    Payloads submitted within `max_wait_ms` of each other (up to `max_batch_size`)
+    are grouped by (user_id, async_mode, mode) and sent as one `/product/add_batch`
+    request each; every caller gets back the response entry for its own payload.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, max_batch_size: int = 16, max_wait_ms: int = 50):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    async def submit(self, payload: dict, encoded: bytes | None = None) -> dict:
+        """
+        Queue one add payload and wait for its own entry of the batch response.
+
+        Args:
+            payload: JSON payload compatible with APIADDRequest.
+            encoded: `json_dumps(payload)` if the caller already has it. It is spliced
+                into the batch body as-is, so a payload posted repeatedly is encoded once.
+
+        Raises:
+            httpx.HTTPError: If the batch request carrying this payload failed.
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, encoded, future))
+        return await future
+
+    async def aclose(self):
+        """Stop the background flush task."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups = defaultdict(list)
+            for item in batch:
+                payload = item[0]
+                key = (payload.get("user_id"), payload.get("async_mode"), payload.get("mode"))
+                groups[key].append(item)
+            await asyncio.gather(*(self._flush(items) for items in groups.values()))
+
+    async def _flush(self, items: list[tuple[dict, bytes | None, asyncio.Future]]):
+        if USE_MSGPACK:
+            body, headers = encode_body({"requests": [payload for payload, _, _ in items]})
+        else:
+            # Splice the per-payload JSON bytes instead of re-serializing the whole batch.
+            encoded = (data or json_dumps(payload) for payload, data, _ in items)
+            body, headers = b'{"requests":[' + b",".join(encoded) + b"]}", HEADERS
+        try:
+            resp = await post_with_retry(self.client, ADD_BATCH_URL, body, headers)
+            resp.raise_for_status()
+            results = json_loads(resp.content)["data"]
+            if len(results) != len(items):
+                raise ValueError(
+                    f"add_batch returned {len(results)} results for {len(items)} requests"
+                )
+        except Exception as e:
+            # Fail every pending caller here; raising would kill the worker task and
+            # leave later submit() calls waiting forever
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(items, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+async def call_add_api(
+    client: httpx.AsyncClient,
+    name: str,
+    payload: dict,
+    encoded: bytes | None = None,
+    batcher: AddBatcher | None = None,
+):
     """
     Generic helper to call /product/add and print the payload + response.
 
+    The whole log block is printed after the response arrives, so output of
+    examples running concurrently does not interleave.
+
     Args:
+        client: Shared async HTTP client.
         name: Logical name of this example, printed in logs.
         payload: JSON payload compatible with APIADDRequest.
+        encoded: Optional pre-encoded JSON bytes of `payload`.
+        batcher: If given, the payload goes through this AddBatcher to
+            /product/add_batch instead of its own /product/add request.
     """
-    print("=" * 80)
-    print(f"[*] Example: {name}")
-    print("- Payload:")
-    print(json.dumps(payload, indent=2, ensure_ascii=False))
-
-    try:
-        resp = requests.post(
-            f"{BASE_URL}/add", headers=HEADERS, data=json.dumps(payload), timeout=60
-        )
-    except Exception as e:
-        print(f"- Request failed with exception: {e!r}")
-        print("=" * 80)
-        print()
+    # Encode once: the same bytes are sent (or spliced into a batch body) and logged.
+    encoded = encoded or json_dumps(payload)
+    if batcher is None:
+        body, headers = encode_body(payload) if USE_MSGPACK else (encoded, HEADERS)
+        try:
+            resp = await post_with_retry(client, ADD_URL, body, headers)
+        except httpx.HTTPError as e:
+            print_example(name, payload, None, repr(e), len(body))
+        else:
+            print_example(name, payload, resp.status_code, resp.text, len(body))
         return
 
-    print("- Response:")
-    print(resp.status_code, resp.text)
-    print("=" * 80)
-    print()
+    try:
+        response = await batcher.submit(payload, encoded)
+    except httpx.HTTPStatusError as e:
+        print_example(name, payload, e.response.status_code, e.response.text, len(encoded))
+    except (httpx.HTTPError, ValueError, KeyError) as e:
+        print_example(name, payload, None, repr(e), len(encoded))
+    else:
+        detail = json_dumps(response).decode()
+        print_example(name, payload, response["code"], detail, len(encoded))
 
 
 # ===========================================================================
@@ -77,7 +383,7 @@ def call_add_api(name: str, payload: dict):
 # ===========================================================================
 
 
-def example_01a_string_message_minimal():
+def example_01a_string_message_minimal() -> dict:
     """
     Minimal example using `messages` as a pure string (MessagesType = str).
 
@@ -85,15 +391,13 @@ def example_01a_string_message_minimal():
     - Internally the server will convert this into a text message.
     - Async add is used by default (`async_mode` defaults to "async").
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "messages": "今天心情不错，喝了咖啡。",
     }
-    call_add_api("example_01a_string_message_minimal", payload)
+    return payload
 
 
-def example_01b_standard_chat_triplet():
+def example_01b_standard_chat_triplet() -> dict:
     """
     Standard chat conversation: system + user + assistant.
 
@@ -101,9 +405,7 @@ def example_01b_standard_chat_triplet():
     - Uses system context + explicit timestamps and message_id.
     - This is recommended when you already have structured dialog.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "session_id": SESSION_ID,
         "messages": [
             {
@@ -133,7 +435,7 @@ def example_01b_standard_chat_triplet():
             "source_url": "https://example.com/dialog/standard",
         },
     }
-    call_add_api("example_01b_standard_chat_triplet", payload)
+    return payload
 
 
 # ===========================================================================
@@ -141,7 +443,7 @@ def example_01b_standard_chat_triplet():
 # ===========================================================================
 
 
-def example_02a_assistant_with_tool_calls():
+def example_02a_assistant_with_tool_calls() -> dict:
     """
     Assistant message containing tool_calls (function calls).
 
@@ -149,32 +451,13 @@ def example_02a_assistant_with_tool_calls():
     - `tool_calls` contains a list of function calls with arguments.
     - This matches OpenAI-style function calling structure.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
-        "messages": [
-            {
-                "role": "assistant",
-                "content": None,
-                "tool_calls": [
-                    {
-                        "id": "tool-call-weather-1",
-                        "type": "function",
-                        "function": {
-                            "name": "get_weather",
-                            "arguments": '{"location": "北京"}',
-                        },
-                    }
-                ],
-                "chat_time": "2025-11-24T10:12:00Z",
-                "message_id": "assistant-with-call-1",
-            }
-        ],
+    payload = BASE_PAYLOAD | {
+        "messages": [WEATHER_TOOL_CALL_MESSAGE],
     }
-    call_add_api("example_02a_assistant_with_tool_calls", payload)
+    return payload
 
 
-def example_02b_tool_message_with_result():
+def example_02b_tool_message_with_result() -> dict:
     """
     Tool message returning the result of a tool call.
 
@@ -182,26 +465,9 @@ def example_02b_tool_message_with_result():
     - `tool_call_id` links this message to the original tool call.
     - This is the standard format for tool execution results in OpenAI-style conversations.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "messages": [
-            {
-                "role": "assistant",
-                "content": None,
-                "tool_calls": [
-                    {
-                        "id": "tool-call-weather-1",
-                        "type": "function",
-                        "function": {
-                            "name": "get_weather",
-                            "arguments": '{"location": "北京"}',
-                        },
-                    }
-                ],
-                "chat_time": "2025-11-24T10:12:00Z",
-                "message_id": "assistant-with-call-1",
-            },
+            WEATHER_TOOL_CALL_MESSAGE,
             {
                 "role": "tool",
                 "content": "北京今天天气晴朗，温度25°C，湿度60%。",
@@ -212,10 +478,10 @@ def example_02b_tool_message_with_result():
         ],
         "info": {"source_type": "tool_execution"},
     }
-    call_add_api("example_02b_tool_message_with_result", payload)
+    return payload
 
 
-def example_02c_tool_description_input_output():
+def example_02c_tool_description_input_output() -> dict:
     """
     Custom tool message format: tool_description, tool_input, tool_output.
 
@@ -225,29 +491,10 @@ def example_02c_tool_description_input_output():
     - `tool_output`: the result/output from the tool execution.
     - These are alternative formats for representing tool interactions.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
-        "messages": [
-            {
-                "role": "assistant",
-                "content": None,
-                "tool_calls": [
-                    {
-                        "id": "tool-call-weather-1",
-                        "type": "function",
-                        "function": {
-                            "name": "get_weather",
-                            "arguments": '{"location": "北京"}',
-                        },
-                    }
-                ],
-                "chat_time": "2025-11-24T10:12:00Z",
-                "message_id": "assistant-with-call-1",
-            }
-        ],
+    payload = BASE_PAYLOAD | {
+        "messages": [WEATHER_TOOL_CALL_MESSAGE],
     }
-    call_add_api("example_02c_tool_description_input_output", payload)
+    return payload
 
 
 # ===========================================================================
@@ -255,39 +502,18 @@ def example_02c_tool_description_input_output():
 # ===========================================================================
 
 
-def example_03_multimodal_text_and_image():
+def example_03_multimodal_text_and_image() -> dict:
     """
     Multimodal user message: text + image_url.
 
     - `content` is a list of content parts.
     - Each part can be text/image_url/... etc.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": "帮我看看这张图片大概是什么内容？",
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": "https://example.com/mountain_lake.jpg",
-                            "detail": "high",
-                        },
-                    },
-                ],
-                "chat_time": "2025-11-24T10:20:00Z",
-                "message_id": "mm-img-1",
-            }
-        ],
+    payload = BASE_PAYLOAD | {
+        "messages": [MULTIMODAL_TEXT_IMAGE_MESSAGE],
         "info": {"source_type": "image_analysis"},
     }
-    call_add_api("example_03_multimodal_text_and_image", payload)
+    return payload
 
 
 # ===========================================================================
@@ -295,16 +521,14 @@ def example_03_multimodal_text_and_image():
 # ===========================================================================
 
 
-def example_04a_pure_text_input_items():
+def example_04a_pure_text_input_items() -> dict:
     """
     Pure text input items without dialog context.
 
     - This shape is used when there is no explicit dialog.
     - `messages` is a list of raw input items, not role-based messages.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "messages": [
             {
                 "type": "text",
@@ -317,10 +541,10 @@ def example_04a_pure_text_input_items():
         ],
         "info": {"source_type": "batch_import"},
     }
-    call_add_api("example_04a_pure_text_input_items", payload)
+    return payload
 
 
-def example_04b_pure_file_input_by_file_id():
+def example_04b_pure_file_input_by_file_id() -> dict:
     """
     Pure file input item using file_id (standard format).
 
@@ -331,9 +555,7 @@ def example_04b_pure_file_input_by_file_id():
       * `filename`: optional, but recommended for clarity
       - In practice, you need at least `file_id` OR `file_data` to specify the file.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "messages": [
             {
                 "type": "file",
@@ -345,10 +567,10 @@ def example_04b_pure_file_input_by_file_id():
         ],
         "info": {"source_type": "file_ingestion"},
     }
-    call_add_api("example_04b_pure_file_input_by_file_id", payload)
+    return payload
 
 
-def example_04c_pure_file_input_by_file_data():
+def example_04c_pure_file_input_by_file_data() -> dict:
     """
     Pure file input item using file_data (base64 encoded).
 
@@ -358,24 +580,23 @@ def example_04c_pure_file_input_by_file_data():
       since we're not using `file_id`. At least one of `file_id` or `file_data`
       should be provided in practice.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "messages": [
             {
                 "type": "file",
                 "file": {
-                    "file_data": "base64_encoded_file_content_here",  # at least one of file_id/file_data needed
+                    # at least one of file_id/file_data needed
+                    "file_data": "base64_encoded_file_content_here",
                     "filename": "document.pdf",  # optional
                 },
             }
         ],
         "info": {"source_type": "file_ingestion_base64"},
     }
-    call_add_api("example_04c_pure_file_input_by_file_data", payload)
+    return payload
 
 
-def example_04d_pure_file_input_by_oss_url():
+def example_04d_pure_file_input_by_oss_url() -> dict:
     """
     Pure file input item using file_data with OSS URL.
 
@@ -383,9 +604,7 @@ def example_04d_pure_file_input_by_oss_url():
     - This format is used when files are stored in cloud storage (e.g., Alibaba Cloud OSS).
     - The file_data field accepts both base64-encoded content and OSS URLs.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "messages": [
             {
                 "type": "file",
@@ -397,7 +616,7 @@ def example_04d_pure_file_input_by_oss_url():
         ],
         "info": {"source_type": "file_ingestion_oss"},
     }
-    call_add_api("example_04d_pure_file_input_by_oss_url", payload)
+    return payload
 
 
 # ===========================================================================
@@ -405,7 +624,7 @@ def example_04d_pure_file_input_by_oss_url():
 # ===========================================================================
 
 
-def example_05_deprecated_memory_content_and_doc_path():
+def example_05_deprecated_memory_content_and_doc_path() -> dict:
     """
     Use only deprecated fields to demonstrate the conversion logic:
 
@@ -426,7 +645,7 @@ def example_05_deprecated_memory_content_and_doc_path():
         "session_id": "session_deprecated_1",
         "async_mode": "async",
     }
-    call_add_api("example_05_deprecated_memory_content_and_doc_path", payload)
+    return payload
 
 
 # ===========================================================================
@@ -434,16 +653,14 @@ def example_05_deprecated_memory_content_and_doc_path():
 # ===========================================================================
 
 
-def example_06a_feedback_add():
+def example_06a_feedback_add() -> dict:
     """
     Feedback add example.
 
     - `is_feedback = True` marks this add as user feedback.
     - You can use `custom_tags` and `info` to label the feedback type/source.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "session_id": "session_feedback_1",
         "is_feedback": True,
         "messages": [
@@ -460,10 +677,10 @@ def example_06a_feedback_add():
             "feedback_type": "preference_correction",
         },
     }
-    call_add_api("example_06a_feedback_add", payload)
+    return payload
 
 
-def example_06b_family_travel_conversation():
+def example_06b_family_travel_conversation() -> dict:
     """
     Multi-turn conversation example: family travel planning.
 
@@ -472,9 +689,8 @@ def example_06b_family_travel_conversation():
     - Uses async_mode for asynchronous processing.
     - This example shows a Chinese conversation about summer travel planning for families.
     """
-    payload = {
+    payload = BASE_PAYLOAD | {
         "user_id": "memos_automated_testing",
-        "writable_cube_ids": [MEM_CUBE_ID],
         "session_id": "0610",
         "async_mode": "async",
         "messages": [
@@ -509,10 +725,10 @@ def example_06b_family_travel_conversation():
             "conversation_id": "0610",
         },
     }
-    call_add_api("example_06b_family_travel_conversation", payload)
+    return payload
 
 
-def example_06c_add_with_chat_history():
+def example_06c_add_with_chat_history() -> dict:
     """
     Add memory with chat_history field.
 
@@ -520,9 +736,7 @@ def example_06c_add_with_chat_history():
     - This is useful when you want to add specific messages while providing broader context.
     - The chat_history helps the system understand the conversation flow better.
     """
-    payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    payload = BASE_PAYLOAD | {
         "session_id": "session_with_history",
         "messages": [
             {
@@ -550,7 +764,7 @@ def example_06c_add_with_chat_history():
         ],
         "info": {"source_type": "chat_with_history"},
     }
-    call_add_api("example_06c_add_with_chat_history", payload)
+    return payload
 
 
 # ===========================================================================
@@ -558,7 +772,7 @@ def example_06c_add_with_chat_history():
 # ===========================================================================
 
 
-def example_07a_search_memories():
+async def example_07a_search_memories(client: httpx.AsyncClient):
     """
     Search memories using `APISearchRequest`.
 
@@ -574,25 +788,16 @@ def example_07a_search_memories():
         "include_preference": True,
     }
 
-    print("=" * 80)
-    print("[*] Example: 07a_search_memories")
-    print("- Payload:")
-    print(json.dumps(payload, indent=2, ensure_ascii=False))
-
+    body, headers = encode_body(payload)
     try:
-        resp = requests.post(
-            f"{BASE_URL}/search", headers=HEADERS, data=json.dumps(payload), timeout=60
-        )
-        print("- Response:")
-        print(resp.status_code, resp.text)
-    except Exception as e:
-        print(f"- Request failed with exception: {e!r}")
-
-    print("=" * 80)
-    print()
+        resp = await post_with_retry(client, SEARCH_URL, body, headers)
+    except httpx.HTTPError as e:
+        print_example("07a_search_memories", payload, None, repr(e), len(body))
+    else:
+        print_example("07a_search_memories", payload, resp.status_code, resp.text, len(body))
 
 
-def example_07b_chat_complete():
+async def example_07b_chat_complete(client: httpx.AsyncClient, batcher: AddBatcher | None):
     """
     Chat completion using `APIChatCompleteRequest`.
 
@@ -603,9 +808,7 @@ def example_07b_chat_complete():
     """
     # 1. First, add some relevant memory so the chat has context
     print("[*] Setting up context for chat...")
-    setup_payload = {
-        "user_id": USER_ID,
-        "writable_cube_ids": [MEM_CUBE_ID],
+    setup_payload = BASE_PAYLOAD | {
         "messages": [
             {
                 "role": "user",
@@ -621,16 +824,18 @@ def example_07b_chat_complete():
         # Use sync mode to ensure memory is available immediately for the chat
         "async_mode": "sync",
     }
-    call_add_api("setup_memory_for_chat", setup_payload)
+    await call_add_api(client, "setup_memory_for_chat", setup_payload, batcher=batcher)
 
     # 2. Interactive chat loop
-    print("=" * 80)
+    print(_BAR)
     print("[*] Starting Interactive Chat (type 'exit' or 'quit' to stop)")
-    print("=" * 80)
+    print(_BAR)
 
     while True:
         try:
             # Use input() to get user query from command line, example: "Where can I stay for a week?"
+            # It blocks the event loop on purpose: nothing else runs during the chat, and in
+            # the main thread Ctrl-C still raises KeyboardInterrupt below.
             query = input("\nUser: ").strip()
 
             # Check for exit commands
@@ -653,16 +858,15 @@ def example_07b_chat_complete():
                 "session_id": SESSION_ID,
             }
 
-            resp = requests.post(
-                f"{BASE_URL}/chat/complete", headers=HEADERS, data=json.dumps(payload), timeout=60
-            )
+            body, headers = encode_body(payload)
+            resp = await post_with_retry(client, CHAT_COMPLETE_URL, body, headers)
 
             if resp.status_code == 200:
                 try:
-                    data = resp.json()
+                    data = json_loads(resp.content)
                     answer = data.get("data", {}).get("response", "")
                     print(f"Assistant: {answer}")
-                except Exception as e:
+                except (ValueError, AttributeError) as e:
                     print(f"Error parsing response: {e}")
                     print(resp.text)
             else:
@@ -672,10 +876,10 @@ def example_07b_chat_complete():
         except KeyboardInterrupt:
             print("\nExiting chat...")
             break
-        except Exception as e:
+        except httpx.HTTPError as e:
             print(f"- Request failed with exception: {e!r}")
 
-    print("=" * 80)
+    print(_BAR)
     print()
 
 
@@ -683,21 +887,141 @@ def example_07b_chat_complete():
 # Entry point
 # ===========================================================================
 
+# Add examples with the session_id their payload writes to. Examples sharing a
+# session run in this order; all other examples run concurrently.
+# You can comment out some examples if you do not want to run all of them.
+ADD_EXAMPLES = [
+    (example_01a_string_message_minimal, None),
+    (example_01b_standard_chat_triplet, SESSION_ID),
+    (example_02a_assistant_with_tool_calls, None),
+    (example_02b_tool_message_with_result, None),
+    (example_02c_tool_description_input_output, None),
+    (example_03_multimodal_text_and_image, None),
+    (example_04a_pure_text_input_items, None),
+    (example_04b_pure_file_input_by_file_id, None),
+    (example_04c_pure_file_input_by_file_data, None),
+    (example_04d_pure_file_input_by_oss_url, None),
+    (example_05_deprecated_memory_content_and_doc_path, "session_deprecated_1"),
+    (example_06a_feedback_add, "session_feedback_1"),
+    (example_06b_family_travel_conversation, "0610"),
+    (example_06c_add_with_chat_history, "session_with_history"),
+]
+
+
+# Number of payloads built ahead of the requests currently in flight.
+PAYLOAD_BUFFER_SIZE = 4
+
+
+@functools.cache
+def build_example(example) -> tuple[dict, bytes]:
+    """
+    Build an add example's payload and its JSON bytes once.
+
+    The payloads are static literals, so repeated runs in the same process
+    (e.g. when this script is reused as a load test) reuse the cached bytes.
+    With VALIDATE set, each payload is also checked once against `APIADDRequest`.
+    """
+    payload = example()
+    if VALIDATE:
+        APIADDRequest.model_validate(payload)
+    return payload, json_dumps(payload)
+
+
+async def payload_stream():
+    """Yield (name, session_id, payload, encoded payload) for every entry of ADD_EXAMPLES."""
+    for example, session_id in ADD_EXAMPLES:
+        yield example.__name__, session_id, *build_example(example)
+
+
+async def buffered(source, size: int):
+    """
+    Iterate an async iterator while a background task keeps up to `size` items ready,
+    so producing the next item overlaps with the consumer awaiting the current one.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+    done = object()
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put(item)
+        finally:
+            await queue.put(done)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (item := await queue.get()) is not done:
+            yield item
+        await producer
+    finally:
+        producer.cancel()
+
+
+async def main():
+    """
+    Run the independent add/search examples concurrently on one keep-alive client,
+    then start the interactive chat once they have all finished.
+
+    With BATCH_ADD set, add examples go through an AddBatcher, so payloads submitted
+    together are sent to /product/add_batch in a few requests instead of one each.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXAMPLES)
+
+    async def run_add_example(
+        client: httpx.AsyncClient,
+        batcher: AddBatcher | None,
+        name: str,
+        payload: dict,
+        encoded: bytes,
+        previous,
+    ):
+        # Examples writing to the same session wait for the previous one in that session.
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        async with semaphore:
+            await call_add_api(client, name, payload, encoded, batcher)
+
+    async def run_add_examples(client: httpx.AsyncClient, batcher: AddBatcher | None):
+        session_tails: dict[str, asyncio.Task] = {}
+        tasks = []
+        stream = buffered(payload_stream(), PAYLOAD_BUFFER_SIZE)
+        async for name, session_id, payload, encoded in stream:
+            previous = session_tails.get(session_id) if session_id else None
+            task = asyncio.create_task(
+                run_add_example(client, batcher, name, payload, encoded, previous)
+            )
+            if session_id:
+                session_tails[session_id] = task
+            tasks.append(task)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_search_example(client: httpx.AsyncClient):
+        async with semaphore:
+            await example_07a_search_memories(client)
+
+    async with httpx.AsyncClient(
+        headers=HEADERS,
+        http2=HTTP2_ENABLED,
+        limits=CLIENT_LIMITS,
+        timeout=60,
+    ) as client:
+        # Open the keep-alive connection up front so the first example does not pay for it.
+        with contextlib.suppress(httpx.HTTPError):
+            await client.head(BASE_URL, timeout=2)
+        batcher = AddBatcher(client) if BATCH_ADD else None
+        try:
+            await asyncio.gather(
+                run_add_examples(client, batcher),
+                run_search_example(client),
+                return_exceptions=True,
+            )
+            sys.stdout.flush()
+            # Interactive and reads from stdin, so it must run on its own.
+            await example_07b_chat_complete(client, batcher)
+        finally:
+            if batcher is not None:
+                await batcher.aclose()
+
+
 if __name__ == "__main__":
-    # You can comment out some examples if you do not want to run all of them.
-    example_01a_string_message_minimal()
-    example_01b_standard_chat_triplet()
-    example_02a_assistant_with_tool_calls()
-    example_02b_tool_message_with_result()
-    example_02c_tool_description_input_output()
-    example_03_multimodal_text_and_image()
-    example_04a_pure_text_input_items()
-    example_04b_pure_file_input_by_file_id()
-    example_04c_pure_file_input_by_file_data()
-    example_04d_pure_file_input_by_oss_url()
-    example_05_deprecated_memory_content_and_doc_path()
-    example_06a_feedback_add()
-    example_06b_family_travel_conversation()
-    example_06c_add_with_chat_history()
-    example_07a_search_memories()
-    example_07b_chat_complete()
+    asyncio.run(main())
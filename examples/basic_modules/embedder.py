@@ -17,9 +17,6 @@ config = EmbedderConfigFactory.model_validate(
 )
 embedder = EmbedderFactory.from_config(config)
 text = "This is a sample text for embedding generation."
-embedding = embedder.embed([text])
-print("Scenario 1 embedding shape:", len(embedding[0]))
-print("==" * 20)
 
 
 # Scenario 2: Batch embedding generation
@@ -29,7 +26,14 @@ texts = [
     "Second sample text for batch embedding.",
     "Third sample text for batch embedding.",
 ]
-embeddings = embedder.embed(texts)
+
+# Scenarios 1 and 2 use the same embedder, so all their texts go out in one batched
+# call (one round trip to Ollama) and the results are split back by position.
+all_embeddings = embedder.embed([text, *texts])
+embedding, embeddings = all_embeddings[:1], all_embeddings[1:]
+
+print("Scenario 1 embedding shape:", len(embedding[0]))
+print("==" * 20)
 print("Scenario 2 batch embeddings count:", len(embeddings))
 print("Scenario 2 first embedding shape:", len(embeddings[0]))
 print("==" * 20)
@@ -52,6 +56,18 @@ embedder_hf = EmbedderFactory.from_config(config_hf)
 text_hf = "This is a sample text for Hugging Face embedding generation."
 embedding_hf = embedder_hf.embed([text_hf])
 print("Scenario 3 HF embedding shape:", len(embedding_hf[0]))
+
+# To serialize vectors (e.g. to send them over HTTP), pack the embeddings into a float32
+# numpy array: orjson writes its buffer directly instead of walking lists of Python floats.
+try:
+    import numpy as np
+    import orjson
+
+    vectors_hf = np.asarray(embedding_hf, dtype=np.float32)
+    payload_hf = orjson.dumps({"embeddings": vectors_hf}, option=orjson.OPT_SERIALIZE_NUMPY)
+    print("Scenario 3 HF serialized embeddings size (bytes):", len(payload_hf))
+except ImportError:
+    print("Scenario 3: install orjson to serialize numpy embeddings directly")
 print("==" * 20)
 
 # === Scenario 4: Using UniversalAPIEmbedder(OpenAI) ===
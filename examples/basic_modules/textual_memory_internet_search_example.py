@@ -54,6 +54,10 @@ from memos.memories.textual.tree_text_memory.retrieve.internet_retriever_factory
 
 logger = log.get_logger(__name__)
 
+# Number of content characters shown per result
+CONTENT_PREVIEW_CHARS = 300
+
+
 # ============================================================================
 # Step 0: Setup - Load configuration files
 # ============================================================================
@@ -171,17 +175,17 @@ else:
 
         # Display the memory content (truncated for readability)
         content = item.memory
-        if len(content) > 300:
-            print(f"Content: {content[:300]}...")
-            print(f"         (... {len(content) - 300} more characters)")
+        extra = len(content) - CONTENT_PREVIEW_CHARS
+        if extra > 0:
+            print(f"Content: {content[:CONTENT_PREVIEW_CHARS]}...")
+            print(f"         (... {extra} more characters)")
         else:
             print(f"Content: {content}")
 
-        # Display metadata if available
-        if hasattr(item, "metadata") and item.metadata:
-            metadata = item.metadata
-            if hasattr(metadata, "sources") and metadata.sources:
-                print(f"Source: {metadata.sources[0] if metadata.sources else 'N/A'}")
+        # Display the first source if available
+        source = item.metadata.first_source
+        if source is not None:
+            print(f"Source: {source}")
 
         print()
 
@@ -263,17 +267,17 @@ if google_api_key and google_search_engine_id:
 
             # Display the memory content (truncated for readability)
             content = item.memory
-            if len(content) > 300:
-                print(f"Content: {content[:300]}...")
-                print(f"         (... {len(content) - 300} more characters)")
+            extra = len(content) - CONTENT_PREVIEW_CHARS
+            if extra > 0:
+                print(f"Content: {content[:CONTENT_PREVIEW_CHARS]}...")
+                print(f"         (... {extra} more characters)")
             else:
                 print(f"Content: {content}")
 
-            # Display metadata if available
-            if hasattr(item, "metadata") and item.metadata:
-                metadata = item.metadata
-                if hasattr(metadata, "sources") and metadata.sources:
-                    print(f"Source: {metadata.sources[0] if metadata.sources else 'N/A'}")
+            # Display the first source if available
+            source = item.metadata.first_source
+            if source is not None:
+                print(f"Source: {source}")
 
             print()
 
@@ -23,9 +23,10 @@ Run this example:
 import json
 import os
 
-from memos import log
+from memos import log, settings
 from memos.configs.embedder import EmbedderConfigFactory
 from memos.configs.graph_db import GraphDBConfigFactory
+from memos.embedders.cached import CachingEmbedder
 from memos.embedders.factory import EmbedderFactory
 from memos.graph_dbs.factory import GraphStoreFactory
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
@@ -58,7 +59,11 @@ print(f"\n✓ Loaded configuration from: {config_path}")
 # ============================================================================
 # The embedder converts text into vector embeddings for semantic search
 embedder_config = EmbedderConfigFactory.model_validate(config_data["embedder"])
-embedder = EmbedderFactory.from_config(embedder_config)
+# Cache vectors on disk so re-running the example does not re-embed the same texts
+embedder = CachingEmbedder(
+    EmbedderFactory.from_config(embedder_config),
+    cache_path=settings.MEMOS_DIR / "embedding_cache.sqlite3",
+)
 
 print(f"✓ Initialized embedder: {embedder_config.backend}")
 
@@ -112,12 +117,12 @@ mock_memories = [
     },
 ]
 
-for idx, mem_data in enumerate(mock_memories, 1):
-    # Generate embedding for this memory
-    mem_embedding = embedder.embed([mem_data["memory"]])[0]
+# Embed all memories in one batched call instead of one call per memory
+mem_embeddings = embedder.embed([mem_data["memory"] for mem_data in mock_memories])
 
-    # Create a TextualMemoryItem with metadata
-    item = TextualMemoryItem(
+# Create a TextualMemoryItem with metadata for each memory
+items = [
+    TextualMemoryItem(
         memory=mem_data["memory"],
         metadata=TreeNodeTextualMemoryMetadata(
             memory_type="LongTermMemory",  # Can be ShortTermMemory, LongTermMemory, etc.
@@ -127,10 +132,22 @@ for idx, mem_data in enumerate(mock_memories, 1):
             sources=[],
         ),
     )
+    for mem_data, mem_embedding in zip(mock_memories, mem_embeddings, strict=True)
+]
 
-    # Add the memory node to the graph store
-    graph_store.add_node(item.id, item.memory, item.metadata.model_dump())
-    print(f"  [{idx}/{len(mock_memories)}] Added: {mem_data['memory'][:60]}...")
+# Add all memory nodes to the graph store in one batch write
+graph_store.add_nodes_batch(
+    [
+        {
+            "id": item.id,
+            "memory": item.memory,
+            "metadata": item.metadata.model_dump(exclude_none=True),
+        }
+        for item in items
+    ]
+)
+for idx, item in enumerate(items, 1):
+    print(f"  [{idx}/{len(items)}] Added: {item.memory[:60]}...")
 
 print("✓ Mock memories inserted successfully")
 
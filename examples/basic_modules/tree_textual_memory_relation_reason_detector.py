@@ -28,10 +28,11 @@ import json
 import os
 import uuid
 
-from memos import log
+from memos import log, settings
 from memos.configs.embedder import EmbedderConfigFactory
 from memos.configs.graph_db import GraphDBConfigFactory
 from memos.configs.llm import LLMConfigFactory
+from memos.embedders.cached import CachingEmbedder
 from memos.embedders.factory import EmbedderFactory
 from memos.graph_dbs.factory import GraphStoreFactory
 from memos.graph_dbs.item import GraphDBNode
@@ -74,7 +75,11 @@ print(f"\n✓ Loaded configuration from: {config_path}")
 print("\n[Step 1] Initializing embedder...")
 
 embedder_config = EmbedderConfigFactory.model_validate(config_data["embedder"])
-embedder = EmbedderFactory.from_config(embedder_config)
+# Cache vectors on disk so re-running the example does not re-embed the same texts
+embedder = CachingEmbedder(
+    EmbedderFactory.from_config(embedder_config),
+    cache_path=settings.MEMOS_DIR / "embedding_cache.sqlite3",
+)
 
 print(f"✓ Embedder initialized: {embedder_config.backend}")
 
@@ -116,7 +121,6 @@ node_a = GraphDBNode(
     memory="Caroline faced increased workload stress during the project deadline.",
     metadata=TreeNodeTextualMemoryMetadata(
         memory_type="LongTermMemory",
-        embedding=[0.1] * 10,  # Placeholder embedding (real one will be generated)
         key="Workload stress",
         tags=["stress", "workload"],
         type="fact",
@@ -131,7 +135,6 @@ node_b = GraphDBNode(
     memory="After joining the support group, Caroline reported improved mental health.",
     metadata=TreeNodeTextualMemoryMetadata(
         memory_type="LongTermMemory",
-        embedding=[0.1] * 10,
         key="Improved mental health",
         tags=["mental health", "support group"],
         type="fact",
@@ -148,7 +151,6 @@ node_c = GraphDBNode(
     memory="Peer support groups are effective in reducing stress for LGBTQ individuals.",
     metadata=TreeNodeTextualMemoryMetadata(
         memory_type="LongTermMemory",
-        embedding=[0.1] * 10,
         key="Support group benefits",
         tags=["LGBTQ", "support group", "stress"],
         type="fact",
@@ -165,7 +167,6 @@ node_d = GraphDBNode(
     memory="Excessive work pressure increases stress levels among employees.",
     metadata=TreeNodeTextualMemoryMetadata(
         memory_type="LongTermMemory",
-        embedding=[0.1] * 10,
         key="Work pressure impact",
         tags=["stress", "work pressure"],
         type="fact",
@@ -182,7 +183,6 @@ node_e = GraphDBNode(
     memory="High stress levels often result in poor sleep quality.",
     metadata=TreeNodeTextualMemoryMetadata(
         memory_type="LongTermMemory",
-        embedding=[0.1] * 10,
         key="Stress and sleep",
         tags=["stress", "sleep"],
         type="fact",
@@ -199,7 +199,6 @@ node_f = GraphDBNode(
     memory="Employees with poor sleep show reduced work performance.",
     metadata=TreeNodeTextualMemoryMetadata(
         memory_type="LongTermMemory",
-        embedding=[0.1] * 10,
         key="Sleep and performance",
         tags=["sleep", "performance"],
         type="fact",
@@ -217,9 +216,6 @@ node = GraphDBNode(
     memory="Caroline joined an LGBTQ support group to cope with work-related stress.",
     metadata=TreeNodeTextualMemoryMetadata(
         memory_type="LongTermMemory",
-        embedding=embedder.embed(
-            ["Caroline joined an LGBTQ support group to cope with work-related stress."]
-        )[0],  # Generate real embedding for the main node
         key="Caroline LGBTQ stress",
         tags=["LGBTQ", "support group", "stress"],
         type="fact",
@@ -236,8 +232,15 @@ print("  ✓ Main Node: Caroline's support group action\n")
 print("[Step 5] Inserting all nodes into graph database...")
 
 all_nodes = [node, node_a, node_b, node_c, node_d, node_e, node_f]
-for n in all_nodes:
-    graph_store.add_node(n.id, n.memory, n.metadata.dict())
+
+# Generate the embeddings of all nodes in one batched call
+for n, embedding in zip(all_nodes, embedder.embed([n.memory for n in all_nodes]), strict=True):
+    n.metadata.embedding = embedding
+
+# Keep None fields: these nodes leave `sources` unset, and the graph store reads that key
+graph_store.add_nodes_batch(
+    [{"id": n.id, "memory": n.memory, "metadata": n.metadata.model_dump()} for n in all_nodes]
+)
 
 print(f"✓ Successfully inserted {len(all_nodes)} memory nodes into the graph\n")
 
@@ -337,13 +340,3 @@ print("  - Modify the mock memories to test different scenarios")
 print("  - Adjust top_k parameter to control how many neighbors are considered")
 print("  - Experiment with different LLM models for relation detection")
 print("  - Check the Neo4j database to visualize the created graph\n")
-
-print("\n=== Aggregate Concepts ===")
-if not results["aggregate_nodes"]:
-    print("No aggregate concepts generated.")
-else:
-    for agg in results["aggregate_nodes"]:
-        print(f"  Concept Key: {agg.metadata.key}")
-        print(f"  Concept Memory: {agg.memory}")
-        print(f"  Sources: {agg.metadata.sources}")
-        print("------")
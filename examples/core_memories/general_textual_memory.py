@@ -7,7 +7,8 @@ from memos.memories.factory import MemoryFactory
 
 # Initialize the memory configuration
 # This configuration specifies the extractor, vector database, and embedder backend.
-# Here we use OpenAI for extraction, Qdrant for vector storage, and Ollama for embedding.
+# Here we use OpenAI for extraction, in-memory Qdrant for vector storage, and Ollama for
+# embedding.
 config = MemoryConfigFactory(
     backend="general_text",
     config={
@@ -31,6 +32,11 @@ config = MemoryConfigFactory(
                 "collection_name": "test_textual_memory",
                 "distance_metric": "cosine",
                 "vector_dimension": 768,  # nomic-embed-text model's embedding dimension is 768
+                # Run Qdrant in-process without persistence: for a handful of vectors an exact
+                # in-memory scan is fastest, and the example saves its state with m.dump()
+                "path": ":memory:",
+                # Store vectors as float16: half the memory and scan bandwidth of float32
+                "vector_datatype": "float16",
             },
         },
         "embedder": {
@@ -68,31 +74,29 @@ example_memories = [
 
 example_id = "a19b6caa-5d59-42ad-8c8a-e4f7118435b4"
 
+# A manually created memory item with a fixed ID
+manual_memory = {
+    "id": example_id,
+    "memory": "User is Chinese.",
+    "metadata": {
+        "key": "User Nationality",
+        "source": "conversation",
+        "tags": ["Nationality"],
+        "updated_at": "2025-05-18T00:00:00",
+    },
+}
+
 print("==== Add memories ====")
-# Add example memories to the memory store
-m.add(example_memories)
-# Add a manually created memory item
-m.add(
-    [
-        {
-            "id": example_id,
-            "memory": "User is Chinese.",
-            "metadata": {
-                "key": "User Nationality",
-                "source": "conversation",
-                "tags": ["Nationality"],
-                "updated_at": "2025-05-18T00:00:00",
-            },
-        }
-    ]
-)
+# Add all memories in one call: they are embedded in one batch and upserted together
+m.add([*example_memories, manual_memory])
 print("All memories after addition:")
 pprint.pprint(m.get_all())
 print()
 
 print("==== Search memories ====")
-# Search for memories related to a query
-search_results = m.search("Tell me more about the user", top_k=2)
+# Search for memories related to a query, blending keyword (BM25) relevance into the
+# vector similarity ranking with alpha=0.6
+search_results = m.search("Tell me more about the user", top_k=2, alpha=0.6)
 pprint.pprint(search_results)
 print()
 
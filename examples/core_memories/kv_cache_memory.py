@@ -1,5 +1,3 @@
-import json
-
 from transformers import DynamicCache
 
 from memos.configs.memory import MemoryConfigFactory
@@ -7,33 +5,39 @@ from memos.memories.activation.item import KVCacheItem
 from memos.memories.factory import MemoryFactory
 
 
+# Pretty-print with orjson when available; it is much faster than the stdlib on nested dicts
+try:
+    import orjson
+
+    def to_json(obj) -> str:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    import json
+
+    def to_json(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
+
 def get_cache_info(cache):
     if not cache:
         return None
 
-    num_layers = 0
-    total_size_bytes = 0
-
     if hasattr(cache, "layers"):
         num_layers = len(cache.layers)
-        for layer in cache.layers:
-            if hasattr(layer, "key_cache") and layer.key_cache is not None:
-                total_size_bytes += layer.key_cache.nelement() * layer.key_cache.element_size()
-            if hasattr(layer, "value_cache") and layer.value_cache is not None:
-                total_size_bytes += layer.value_cache.nelement() * layer.value_cache.element_size()
-
-            if hasattr(layer, "keys") and layer.keys is not None:
-                total_size_bytes += layer.keys.nelement() * layer.keys.element_size()
-            if hasattr(layer, "values") and layer.values is not None:
-                total_size_bytes += layer.values.nelement() * layer.values.element_size()
-
+        tensors = [
+            getattr(layer, name, None)
+            for layer in cache.layers
+            for name in ("key_cache", "value_cache", "keys", "values")
+        ]
     elif hasattr(cache, "key_cache") and hasattr(cache, "value_cache"):
         num_layers = len(cache.key_cache)
-        for k, v in zip(cache.key_cache, cache.value_cache, strict=False):
-            if k is not None:
-                total_size_bytes += k.nelement() * k.element_size()
-            if v is not None:
-                total_size_bytes += v.nelement() * v.element_size()
+        tensors = [*cache.key_cache, *cache.value_cache]
+    else:
+        num_layers, tensors = 0, []
+
+    total_size_bytes = sum(t.nelement() * t.element_size() for t in tensors if t is not None)
 
     return {
         "num_layers": num_layers,
@@ -78,6 +82,8 @@ if __name__ == "__main__":
                     "remove_think_prefix": True,
                 },
             },
+            # Store dumped caches as per-head int8 tensors (about half the size of bf16)
+            "quantize_dump": True,
         },
     )
 
@@ -91,19 +97,19 @@ if __name__ == "__main__":
     ]
     print("===== Extract KVCacheItem =====")
     cache_item = kv_mem.extract(prompt)
-    print(json.dumps(serialize_item(cache_item), indent=2, default=str))
+    print(to_json(serialize_item(cache_item)))
     print()
 
     # 4. Add the extracted KVCacheItem
     print("===== Add KVCacheItem =====")
     kv_mem.add([cache_item])
-    print(json.dumps(serialize_item(kv_mem.get_all()), indent=2, default=str))
+    print(to_json(serialize_item(kv_mem.get_all())))
     print()
 
     # 5. Get by id
     print("===== Get KVCacheItem by id =====")
     retrieved = kv_mem.get(cache_item.id)
-    print(json.dumps(serialize_item(retrieved), indent=2, default=str))
+    print(to_json(serialize_item(retrieved)))
     print()
 
     # 6. Merge caches (simulate with two items)
@@ -111,13 +117,13 @@ if __name__ == "__main__":
     item2 = kv_mem.extract([{"role": "user", "content": "Tell me a joke."}])
     kv_mem.add([item2])
     merged_cache = kv_mem.get_cache([cache_item.id, item2.id])
-    print(json.dumps(serialize_item(merged_cache), indent=2, default=str))
+    print(to_json(serialize_item(merged_cache)))
     print()
 
     # 7. Delete one
     print("===== Delete one KVCacheItem =====")
     kv_mem.delete([cache_item.id])
-    print(json.dumps(serialize_item(kv_mem.get_all()), indent=2, default=str))
+    print(to_json(serialize_item(kv_mem.get_all())))
     print()
 
     # 8. Dump and load
@@ -128,5 +134,5 @@ if __name__ == "__main__":
     kv_mem.load("tmp/kv_mem")
     print(
         "Memory loaded from 'tmp/kv_mem':",
-        json.dumps(serialize_item(kv_mem.get_all()), indent=2, default=str),
+        to_json(serialize_item(kv_mem.get_all())),
     )
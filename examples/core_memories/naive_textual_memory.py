@@ -46,19 +46,16 @@ example_memories = [
 
 example_id = str(uuid.uuid4())
 
+# A manually created memory item with a known ID
+manual_memory = {
+    "id": example_id,
+    "memory": "User is Chinese.",
+    "metadata": {"type": "opinion"},
+}
+
 print("==== Add memories ====")
-# Add example memories to the memory store
-m.add(example_memories)
-# Manually create a memory item and add it
-m.add(
-    [
-        {
-            "id": example_id,
-            "memory": "User is Chinese.",
-            "metadata": {"type": "opinion"},
-        }
-    ]
-)
+# Add all memories to the memory store in one call
+m.add([*example_memories, manual_memory])
 print("All memories after addition:")
 pprint.pprint(m.get_all())
 print()
@@ -2,7 +2,6 @@ import sys
 import threading
 import time
 
-import requests
 import uvicorn
 
 from memos.extras.nli_model.client import NLIClient
@@ -13,49 +12,34 @@ from memos.extras.nli_model.server.serve import app
 PORT = 32534
 
 
-def run_server():
-    print(f"Starting server on port {PORT}...")
-    # Using a separate thread for the server
-    uvicorn.run(app, host="127.0.0.1", port=PORT, log_level="info")
+# Poll interval while waiting for the server to finish startup (model load included)
+READY_POLL_INTERVAL = 0.05
 
 
 def main():
     print("Initializing E2E Test...")
 
-    # Start server thread
-    server_thread = threading.Thread(target=run_server, daemon=True)
+    # Start the server in a background thread; `server.started` is set by uvicorn once the
+    # app lifespan (which loads the NLI model) has completed and the socket is listening
+    print(f"Starting server on port {PORT}...")
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=PORT, log_level="info"))
+    server_thread = threading.Thread(target=server.run, daemon=True)
     server_thread.start()
 
     # Wait for server to be up
     print("Waiting for server to initialize (this may take time if downloading model)...")
     client = NLIClient(base_url=f"http://127.0.0.1:{PORT}")
 
-    # Poll until server is ready
-    start_time = time.time()
-    ready = False
-
     # Wait up to 5 minutes for model download and initialization
     timeout = 300
+    deadline = time.monotonic() + timeout
+
+    # Stop waiting as soon as the server is ready or its thread has exited on a startup error
+    while not server.started and server_thread.is_alive() and time.monotonic() < deadline:
+        time.sleep(READY_POLL_INTERVAL)
 
-    while time.time() - start_time < timeout:
-        try:
-            # Check if docs endpoint is accessible
-            resp = requests.get(f"http://127.0.0.1:{PORT}/docs", timeout=1)
-            if resp.status_code == 200:
-                ready = True
-                break
-        except requests.ConnectionError:
-            pass
-        except Exception:
-            # Ignore other errors during startup
-            pass
-
-        time.sleep(2)
-        print(".", end="", flush=True)
-
-    print("\n")
-    if not ready:
-        print("Server failed to start in time.")
+    if not server.started:
+        print("Server failed to start (startup error or timeout).")
         sys.exit(1)
 
     print("Server is up! Sending request...")
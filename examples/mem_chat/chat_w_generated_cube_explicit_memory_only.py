@@ -93,6 +93,21 @@ def get_mem_cube_config() -> GeneralMemCubeConfig:
                             "collection_name": "user03alice_mem_cube_general",
                             "vector_dimension": 1024,
                             "distance_metric": "cosine",
+                            # On a Qdrant server, search int8-quantized vectors held in RAM and
+                            # keep the float32 originals on disk for rescoring
+                            "quantization": "scalar",
+                            "on_disk": True,
+                            # HNSW graph for approximate search once a collection outgrows
+                            # full_scan_threshold (in KB of vectors). For high-recall deployments,
+                            # try {"m": 32, "ef_construct": 256} with "hnsw_ef": 256.
+                            "hnsw_config": {
+                                "m": 16,
+                                "ef_construct": 128,
+                                "full_scan_threshold": 10000,
+                                "on_disk": False,
+                            },
+                            # Search-time beam size: raise for recall, lower for latency
+                            "hnsw_ef": 64,
                         },
                     },
                     "embedder": {
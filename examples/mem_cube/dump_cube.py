@@ -18,10 +18,10 @@ Note on Embeddings:
     search results may be inaccurate or fail.
 """
 
-import contextlib
 import json
 import os
 import shutil
+import threading
 
 from memos.api.handlers import init_server
 from memos.api.product_models import APIADDRequest
@@ -31,6 +31,59 @@ from memos.multi_mem_cube.single_cube import SingleCubeView
 
 logger = get_logger(__name__)
 
+# orjson parses and writes large embedding arrays much faster than the stdlib
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+# Number of nodes fetched from the graph store per export_graph call
+EXPORT_PAGE_SIZE = 500
+
+
+def iter_export_pages(graph_store, user_name: str, page_size: int = EXPORT_PAGE_SIZE):
+    """Yield (nodes, edges) one export_graph page at a time instead of the whole graph."""
+    page = 1
+    while True:
+        data = graph_store.export_graph(
+            include_embedding=True,  # Include embeddings for semantic search
+            user_name=user_name,  # Filter by cube_id (pushed down to an indexed WHERE clause)
+            page=page,
+            page_size=page_size,
+        )
+        nodes, edges = data.get("nodes", []), data.get("edges", [])
+        yield nodes, edges
+        if len(nodes) < page_size and len(edges) < page_size:
+            return
+        page += 1
+
+
+def fix_embedding(node: dict) -> dict:
+    """Parse a string embedding to a list for import compatibility.
+
+    export_graph stores embedding as string in metadata, but add_node expects list.
+    """
+    metadata = node.get("metadata", {})
+    embedding = metadata.get("embedding")
+    if isinstance(embedding, str):
+        # Plain try/except: this runs once per node, and suppress() builds a context manager each time
+        try:
+            embedding = json_loads(embedding)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
+            return node  # Leave an unparseable embedding as it is
+        metadata["embedding"] = embedding
+    return node
+
+
 # NEW cube_id to avoid dumping existing data
 EXAMPLE_CUBE_ID = "example_dump_cube"
 EXAMPLE_USER_ID = "example_user"
@@ -92,40 +145,60 @@ print("Step 4: Dump cube data (filtered by cube_id)")
 print("=" * 60)
 
 output_dir = "tmp/mem_cube_dump"
+# Write into a staging directory and swap it in at the end, so a previous dump stays
+# complete and readable until the new one is finished
+staging_dir = f"{output_dir}.new.{os.getpid()}"
+# A leftover from an earlier run that crashed with the same PID would make makedirs fail
+shutil.rmtree(staging_dir, ignore_errors=True)
+os.makedirs(staging_dir)
+
+try:
+    # Export only this cube's data page by page and stream it to the file, so only one
+    # page of nodes (with their embeddings) is held in memory at a time
+    text_mem = naive.text_mem
+    memory_file = os.path.join(staging_dir, "textual_memory.json")
+    num_nodes = 0
+    edges = []
+    with open(memory_file, "wb") as f:
+        f.write(b'{"nodes": [')
+        for page_nodes, page_edges in iter_export_pages(text_mem.graph_store, EXAMPLE_CUBE_ID):
+            for node in page_nodes:
+                if num_nodes:
+                    f.write(b",")
+                f.write(json_dumps(fix_embedding(node)))
+                num_nodes += 1
+            # Edges only hold ids and a type, so they are cheap to collect until the end
+            edges.extend(page_edges)
+        f.write(b'], "edges": ')
+        f.write(json_dumps(edges))
+        f.write(b"}")
+
+    print(f"✓ Exported {num_nodes} nodes")
+
+    # Save config (user can modify sensitive fields before sharing)
+    # Dump to a plain dict and edit that, instead of deep-copying the whole config model
+    config = components["default_cube_config"].model_dump(mode="json", warnings="none")
+    config["user_id"] = EXAMPLE_USER_ID
+    config["cube_id"] = EXAMPLE_CUBE_ID
+    config_file = os.path.join(staging_dir, "config.json")
+    with open(config_file, "wb") as f:
+        f.write(json_dumps(config, indent=True))
+except BaseException:
+    # Do not leave a half-written staging directory behind
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    raise
+
+# Swap the finished dump into place with renames; the old dump is deleted afterwards
+# on a separate thread (the interpreter waits for it before exiting)
+old_dir = f"{output_dir}.old.{os.getpid()}"
+shutil.rmtree(old_dir, ignore_errors=True)  # Same PID-reuse leftover as staging_dir
 if os.path.exists(output_dir):
-    shutil.rmtree(output_dir)
-os.makedirs(output_dir, exist_ok=True)
-
-# Export only this cube's data using user_name filter
-text_mem = naive.text_mem
-json_data = text_mem.graph_store.export_graph(
-    include_embedding=True,  # Include embeddings for semantic search
-    user_name=EXAMPLE_CUBE_ID,  # Filter by cube_id
-)
-
-# Fix embedding format: parse string to list for import compatibility
-# (export_graph stores embedding as string in metadata, but add_node expects list)
-for node in json_data.get("nodes", []):
-    metadata = node.get("metadata", {})
-    if "embedding" in metadata and isinstance(metadata["embedding"], str):
-        with contextlib.suppress(json.JSONDecodeError):
-            metadata["embedding"] = json.loads(metadata["embedding"])
-
-print(f"✓ Exported {len(json_data.get('nodes', []))} nodes")
-
-# Save to file
-memory_file = os.path.join(output_dir, "textual_memory.json")
-with open(memory_file, "w", encoding="utf-8") as f:
-    json.dump(json_data, f, indent=2, ensure_ascii=False)
-print(f"✓ Saved to: {memory_file}")
-
-# Save config (user can modify sensitive fields before sharing)
-config = components["default_cube_config"].model_copy(deep=True)
-config.user_id = EXAMPLE_USER_ID
-config.cube_id = EXAMPLE_CUBE_ID
-config_file = os.path.join(output_dir, "config.json")
-config.to_json_file(config_file)
-print(f"✓ Config saved to: {config_file}")
+    os.rename(output_dir, old_dir)
+os.rename(staging_dir, output_dir)
+if os.path.exists(old_dir):
+    threading.Thread(target=shutil.rmtree, args=(old_dir,), kwargs={"ignore_errors": True}).start()
+print(f"✓ Saved to: {os.path.join(output_dir, 'textual_memory.json')}")
+print(f"✓ Config saved to: {os.path.join(output_dir, 'config.json')}")
 
 # =============================================================================
 # Done
@@ -28,6 +28,18 @@ from memos.multi_mem_cube.single_cube import SingleCubeView
 
 logger = get_logger(__name__)
 
+# orjson parses large embedding arrays much faster than the stdlib
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Nodes handed to import_graph per call
+IMPORT_CHUNK_SIZE = 500
+
+
 EXAMPLE_CUBE_ID = "example_dump_cube"
 EXAMPLE_USER_ID = "example_user"
 
@@ -75,15 +87,19 @@ if not os.path.exists(memory_file):
     print("   Run dump_cube.py first to create data!")
     exit(1)
 
-with open(memory_file, encoding="utf-8") as f:
-    json_data = json.load(f)
+with open(memory_file, "rb") as f:
+    json_data = json_loads(f.read())
 
-# Import graph data into graph_store
+# Import graph data into graph_store chunk by chunk, so each call sends a bounded
+# request; edges go last, once all their endpoints exist
 text_mem = naive.text_mem
-text_mem.graph_store.import_graph(json_data, user_name=EXAMPLE_CUBE_ID)
-
 nodes = json_data.get("nodes", [])
 edges = json_data.get("edges", [])
+for start in range(0, len(nodes), IMPORT_CHUNK_SIZE):
+    chunk = nodes[start : start + IMPORT_CHUNK_SIZE]
+    text_mem.graph_store.import_graph({"nodes": chunk, "edges": []}, user_name=EXAMPLE_CUBE_ID)
+text_mem.graph_store.import_graph({"nodes": [], "edges": edges}, user_name=EXAMPLE_CUBE_ID)
+
 print(f"✓ Imported {len(nodes)} nodes, {len(edges)} edges")
 
 # =============================================================================
@@ -6,6 +6,31 @@ import sys
 # Add project root to python path to ensure src modules can be imported
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../src")))
 
+from dotenv import load_dotenv
+
+
+# Load environment variables before memos modules read any configuration at import time
+load_dotenv()
+
+from memos.configs.embedder import EmbedderConfigFactory  # noqa: E402
+from memos.configs.graph_db import GraphDBConfigFactory  # noqa: E402
+from memos.configs.llm import LLMConfigFactory  # noqa: E402
+from memos.configs.mem_reader import MemReaderConfigFactory  # noqa: E402
+from memos.configs.reranker import RerankerConfigFactory  # noqa: E402
+from memos.embedders.factory import EmbedderFactory  # noqa: E402
+from memos.graph_dbs.factory import GraphStoreFactory  # noqa: E402
+from memos.llms.factory import LLMFactory  # noqa: E402
+from memos.mem_feedback.simple_feedback import SimpleMemFeedback  # noqa: E402
+from memos.mem_feedback.utils import make_mem_item  # noqa: E402
+from memos.mem_reader.factory import MemReaderFactory  # noqa: E402
+from memos.memories.textual.tree_text_memory.organize.manager import MemoryManager  # noqa: E402
+from memos.memories.textual.tree_text_memory.retrieve.searcher import Searcher  # noqa: E402
+from memos.reranker.factory import RerankerFactory  # noqa: E402
+
+
+# Maximum number of texts sent to the embedder in a single request
+EMBED_BATCH_SIZE = 64
+
 
 def init_components():
     """
@@ -24,21 +49,6 @@ def init_components():
     Returns:
         tuple: (feedback_server, memory_manager, embedder)
     """
-    # Lazy import to avoid E402 (module level import not at top of file)
-    from memos.configs.embedder import EmbedderConfigFactory
-    from memos.configs.graph_db import GraphDBConfigFactory
-    from memos.configs.llm import LLMConfigFactory
-    from memos.configs.mem_reader import MemReaderConfigFactory
-    from memos.configs.reranker import RerankerConfigFactory
-    from memos.embedders.factory import EmbedderFactory
-    from memos.graph_dbs.factory import GraphStoreFactory
-    from memos.llms.factory import LLMFactory
-    from memos.mem_feedback.simple_feedback import SimpleMemFeedback
-    from memos.mem_reader.factory import MemReaderFactory
-    from memos.memories.textual.tree_text_memory.organize.manager import MemoryManager
-    from memos.memories.textual.tree_text_memory.retrieve.searcher import Searcher
-    from memos.reranker.factory import RerankerFactory
-
     print("Initializing MemOS Components...")
 
     # 1. LLM: Configure Large Language Model, using OpenAI compatible interface
@@ -159,14 +169,6 @@ def main():
     4. Process feedback and update memory store.
     5. Display processing results.
     """
-    # Load dotenv in main to avoid affecting module import order
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    # Lazy import to avoid E402
-    from memos.mem_feedback.utils import make_mem_item
-
     feedback_server, memory_manager, embedder = init_components()
     print("-" * 50)
     print("Initialization Done. Processing Feedback...")
@@ -180,29 +182,41 @@ def main():
     ]
 
     # 2. Simulate Initial Memory
-    # We manually add a memory to the database, representing what the system currently believes to be a "fact".
-    # This memory content is "你喜欢苹果,不喜欢香蕉", which we will later correct via feedback.
-    mem_text = "你喜欢苹果,不喜欢香蕉"
+    # We manually add memories to the database, representing what the system currently believes to be "facts".
+    # The memory content "你喜欢苹果,不喜欢香蕉" is what we will later correct via feedback.
+    seed_memories = [
+        {"memory": "你喜欢苹果,不喜欢香蕉", "key": "food_preference"},
+    ]
+
+    # Embed all seed texts with one request per batch instead of one request per memory
+    texts = [seed["memory"] for seed in seed_memories]
+    embeddings = []
+    for start in range(0, len(texts), EMBED_BATCH_SIZE):
+        embeddings.extend(embedder.embed(texts[start : start + EMBED_BATCH_SIZE]))
+
+    # Submit every item in one add() call rather than one call per memory: MemoryManager
+    # writes them to the graph store in UNWIND batches (add_nodes_batch) instead of a
+    # transaction per node. mode="sync" also trims working memory and refreshes memory
+    # sizes afterwards; mode="async" skips that step when seeding many items at once.
     memory_manager.add(
         [
             make_mem_item(
-                mem_text,
+                seed["memory"],
                 user_id="user_id_001",
                 user_name="cube_id_001_0115",
                 session_id="session_id",
                 tags=["fact"],
-                key="food_preference",
+                key=seed["key"],
                 sources=[{"type": "chat"}],
                 background="init from chat history",
-                embedding=embedder.embed([mem_text])[
-                    0
-                ],  # Generate embedding for subsequent retrieval
+                embedding=embedding,  # Used for subsequent retrieval
                 info={
                     "user_id": "user_id_001",
                     "user_name": "cube_id_001_0115",
                     "session_id": "session_id",
                 },
             )
+            for seed, embedding in zip(seed_memories, embeddings, strict=True)
         ],
         user_name="cube_id_001_0115",
         mode="sync",
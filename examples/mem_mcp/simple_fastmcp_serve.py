@@ -1,8 +1,12 @@
 import argparse
 import json
 import os
+import time
 
-import requests
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+import httpx
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
@@ -13,52 +17,170 @@ load_dotenv()
 # Configuration
 # This points to the Server API base URL (e.g., started via server_api.py)
 API_BASE_URL = os.getenv("MEMOS_API_BASE_URL", "http://localhost:8001/product")
+# Connect quickly, but allow chat completions a while to answer
+REQUEST_TIMEOUT = httpx.Timeout(120.0, connect=3.0)
+
+# One pooled async client shared by all tools, so concurrent tool calls overlap their
+# upstream requests over keep-alive connections instead of blocking the event loop.
+# The transport retries only failed connects: retrying a POST that reached the server could add twice.
+CLIENT = httpx.AsyncClient(
+    base_url=API_BASE_URL,
+    timeout=REQUEST_TIMEOUT,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    transport=httpx.AsyncHTTPTransport(retries=3),
+)
+
+# Recent search responses, keyed by (user_id, cube_ids, normalized query).
+# Entries expire after SEARCH_CACHE_TTL seconds and the whole cache is dropped on add_memory.
+# Only adds made through this MCP server clear it: writes from the Server API, the feedback
+# server or other clients can stay invisible to a cached search for up to SEARCH_CACHE_TTL.
+SEARCH_CACHE_SIZE = 128
+SEARCH_CACHE_TTL = 60.0
+_search_cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+
+
+def _search_cache_key(query: str, user_id: str, cube_ids: str | None) -> tuple:
+    return user_id, cube_ids, " ".join(query.casefold().split())
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    try:
+        yield
+    finally:
+        await CLIENT.aclose()
+
 
 # Create MCP Server
-mcp = FastMCP("MemOS MCP via Server API")
+mcp = FastMCP("MemOS MCP via Server API", lifespan=lifespan)
 
 
-@mcp.tool()
-def add_memory(memory_content: str, user_id: str, cube_id: str | None = None):
-    """Add memory using the Server API."""
-    payload = {
+def _add_payload(memory_content: str, user_id: str, cube_id: str | None = None) -> dict:
+    return {
         "user_id": user_id,
         "messages": memory_content,
         "writable_cube_ids": [cube_id] if cube_id else None,
     }
+
+
+async def _search(query: str, user_id: str, cube_ids: str | None = None) -> str:
+    key = _search_cache_key(query, user_id, cube_ids)
+    cached = _search_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+        _search_cache.move_to_end(key)
+        return cached[1]
+
+    payload = {"query": query, "user_id": user_id, "readable_cube_ids": cube_ids}
     try:
-        resp = requests.post(f"{API_BASE_URL}/add", json=payload)
+        resp = await CLIENT.post("/search", json=payload)
         resp.raise_for_status()
-        return resp.json()["message"]
+        # The Server API search response structure matches product API mostly
+        result = json.dumps(resp.json()["data"], ensure_ascii=False)
     except Exception as e:
         return f"Error: {e}"
 
+    _search_cache[key] = (time.monotonic(), result)
+    _search_cache.move_to_end(key)
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+    return result
 
-@mcp.tool()
-def search_memories(query: str, user_id: str, cube_ids: str | None = None):
-    """Search memories using the Server API."""
-    payload = {"query": query, "user_id": user_id, "readable_cube_ids": cube_ids}
+
+async def _chat(query: str, user_id: str) -> str:
+    payload = {"query": query, "user_id": user_id}
     try:
-        resp = requests.post(f"{API_BASE_URL}/search", json=payload)
+        resp = await CLIENT.post("/chat/complete", json=payload)
         resp.raise_for_status()
-        # The Server API search response structure matches product API mostly
-        return json.dumps(resp.json()["data"], ensure_ascii=False)
+        return resp.json()["data"]["response"]
     except Exception as e:
         return f"Error: {e}"
 
 
+async def _add_many(payloads: list[dict]) -> list[str]:
+    """Send several add requests in one /add_batch round trip, returning one result each."""
+    try:
+        resp = await CLIENT.post("/add_batch", json={"requests": payloads})
+        resp.raise_for_status()
+        results = resp.json()["data"]
+        if len(results) != len(payloads):
+            raise ValueError(
+                f"add_batch returned {len(results)} results for {len(payloads)} requests"
+            )
+        # Each entry carries its own code; failed ones have data set to None
+        return [
+            result["message"] if result["code"] == 200 else f"Error: {result['message']}"
+            for result in results
+        ]
+    except Exception as e:
+        return [f"Error: {e}"] * len(payloads)
+    finally:
+        # Some adds may have been stored even if the call failed, and new memories can
+        # change any cached search result
+        _search_cache.clear()
+
+
 @mcp.tool()
-def chat(query: str, user_id: str):
-    """Chat using the Server API."""
-    payload = {"query": query, "user_id": user_id}
+async def add_memory(memory_content: str, user_id: str, cube_id: str | None = None):
+    """Add memory using the Server API."""
     try:
-        resp = requests.post(f"{API_BASE_URL}/chat/complete", json=payload)
+        resp = await CLIENT.post("/add", json=_add_payload(memory_content, user_id, cube_id))
         resp.raise_for_status()
-        return resp.json()["data"]["response"]
+        # New memories can change any cached search result
+        _search_cache.clear()
+        return resp.json()["message"]
     except Exception as e:
         return f"Error: {e}"
 
 
+@mcp.tool()
+async def search_memories(query: str, user_id: str, cube_ids: str | None = None):
+    """Search memories using the Server API."""
+    return await _search(query, user_id, cube_ids)
+
+
+@mcp.tool()
+async def chat(query: str, user_id: str):
+    """Chat using the Server API."""
+    return await _chat(query, user_id)
+
+
+# Field each batch_ops operation cannot run without
+_OP_REQUIRED_FIELDS = {"add_memory": "memory_content", "search_memories": "query", "chat": "query"}
+
+
+@mcp.tool()
+async def batch_ops(ops: list[dict], user_id: str) -> list[str]:
+    """Run several operations in one tool call and return one result per operation.
+
+    Each op is {"op": "add_memory", "memory_content": ..., "cube_id": ...},
+    {"op": "search_memories", "query": ..., "cube_ids": ...} or {"op": "chat", "query": ...}.
+    Consecutive add_memory ops are sent to the Server API as a single /add_batch request.
+    """
+    results: list[str] = []
+    pending_adds: list[dict] = []
+    for op in ops:
+        name = op.get("op")
+        required = _OP_REQUIRED_FIELDS.get(name)
+        if name == "add_memory" and required in op:
+            pending_adds.append(_add_payload(op[required], user_id, op.get("cube_id")))
+            continue
+        # Flush queued adds first so later searches and chats see them
+        if pending_adds:
+            results.extend(await _add_many(pending_adds))
+            pending_adds = []
+        if required is None:
+            results.append(f"Error: unknown op {name!r}")
+        elif required not in op:
+            results.append(f"Error: op {name!r} needs {required!r}")
+        elif name == "search_memories":
+            results.append(await _search(op["query"], user_id, op.get("cube_ids")))
+        else:
+            results.append(await _chat(op["query"], user_id))
+    if pending_adds:
+        results.extend(await _add_many(pending_adds))
+    return results
+
+
 if __name__ == "__main__":
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="MOS MCP Server via API")
@@ -4,6 +4,10 @@ This module provides factory functions to create configured instances of
 LLMs, Embedders, and MemReaders, simplifying the setup process in examples.
 """
 
+import json
+import threading
+
+from collections.abc import Callable
 from typing import Any
 
 from memos.configs.embedder import EmbedderConfigFactory
@@ -22,6 +26,25 @@ from memos.parsers.factory import ParserFactory
 from .settings import get_embedder_config, get_llm_config, get_reader_config
 
 
+# Readers keyed by (kind, config JSON), so repeated builds in one run share an instance.
+# LLMs, embedders and parsers need no cache here: their factories are already singletons.
+_READER_CACHE: dict[tuple[str, str], Any] = {}
+_READER_CACHE_LOCK = threading.Lock()
+
+
+def _get_or_build(kind: str, config: dict[str, Any], build: Callable[[], Any]) -> Any:
+    """Return the cached reader for ``config``, building it on first use."""
+    key = (kind, json.dumps(config, sort_keys=True))
+    component = _READER_CACHE.get(key)
+    if component is None:
+        with _READER_CACHE_LOCK:
+            component = _READER_CACHE.get(key)
+            if component is None:
+                component = build()
+                _READER_CACHE[key] = component
+    return component
+
+
 def build_llm_and_embedder() -> tuple[Any, Any]:
     """Initialize and return configured LLM and Embedder instances."""
     llm_config_dict = get_llm_config()
@@ -63,8 +86,11 @@ def build_simple_reader() -> SimpleStructMemReader:
     """
     config_dict = get_reader_config()
     # Simple reader doesn't need file parser
-    config = SimpleStructMemReaderConfig(**config_dict)
-    return SimpleStructMemReader(config)
+    return _get_or_build(
+        "simple_reader",
+        config_dict,
+        lambda: SimpleStructMemReader(SimpleStructMemReaderConfig(**config_dict)),
+    )
 
 
 def build_multimodal_reader() -> MultiModalStructMemReader:
@@ -74,5 +100,8 @@ def build_multimodal_reader() -> MultiModalStructMemReader:
         Configured MultiModalStructMemReader instance.
     """
     config_dict = get_reader_config()
-    config = MultiModalStructMemReaderConfig(**config_dict)
-    return MultiModalStructMemReader(config)
+    return _get_or_build(
+        "multimodal_reader",
+        config_dict,
+        lambda: MultiModalStructMemReader(MultiModalStructMemReaderConfig(**config_dict)),
+    )
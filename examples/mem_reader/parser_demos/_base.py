@@ -4,7 +4,7 @@ from typing import Any
 
 from examples.mem_reader.builders import build_llm_and_embedder
 from examples.mem_reader.utils import pretty_print_dict
-from memos.memories.textual.item import SourceMessage
+from memos.memories.textual.item import SourceMessage, TextualMemoryItem
 
 
 class BaseParserDemo:
@@ -59,18 +59,64 @@ class BaseParserDemo:
         else:
             print(f"     {rebuilt}")
 
-    def demo_parse_fast(self, message: Any, info: dict):
-        """Demonstrate fast parsing (if supported)."""
+    def parse_fast_batch(
+        self, messages: list[Any], info: dict
+    ) -> list[list[TextualMemoryItem] | Exception]:
+        """Run parse_fast on every message, embedding all resulting memories in one call.
+
+        Messages are parsed with ``need_emb=False`` (as MultiModalStructMemReader does) and
+        items still missing an embedding are sent to the embedder as a single batch. A
+        message whose parsing or embedding fails gets the exception in place of its item list.
+        """
+        results: list[list[TextualMemoryItem] | Exception] = []
+        for message in messages:
+            try:
+                results.append(self.parser.parse_fast(message, info, need_emb=False))
+            except Exception as e:
+                results.append(e)
+
+        pending = [
+            (index, item)
+            for index, items in enumerate(results)
+            if not isinstance(items, Exception)
+            for item in items
+            if item.metadata.embedding is None
+        ]
+        if pending:
+            try:
+                embeddings = self.embedder.embed([item.memory for _, item in pending])
+                for (_, item), embedding in zip(pending, embeddings, strict=True):
+                    item.metadata.embedding = embedding
+            except Exception as e:
+                # Report the failure for every message waiting on the batch
+                for index, _ in pending:
+                    results[index] = e
+        return results
+
+    def demo_parse_fast(
+        self,
+        message: Any,
+        info: dict,
+        parsed: list[TextualMemoryItem] | Exception | None = None,
+    ):
+        """Demonstrate fast parsing (if supported).
+
+        Pass ``parsed`` with the message's entry from ``parse_fast_batch`` to print a
+        result computed ahead of time instead of parsing the message again.
+        """
         if not hasattr(self.parser, "parse_fast"):
             return
 
         print("\n⚡️ Running parse_fast...")
-        try:
-            memory_items = self.parser.parse_fast(message, info)
-            print(f"  📊 Generated {len(memory_items)} memory item(s)")
-            if memory_items:
-                item = memory_items[0]
-                print(f"     - Memory: {item.memory[:60]}...")
-                print(f"     - Type: {item.metadata.memory_type}")
-        except Exception as e:
-            print(f"  ⚠️  parse_fast not applicable or failed: {e}")
+        if parsed is None:
+            parsed = self.parse_fast_batch([message], info)[0]
+        if isinstance(parsed, Exception):
+            print(f"  ⚠️  parse_fast not applicable or failed: {parsed}")
+            return
+
+        memory_items = parsed
+        print(f"  📊 Generated {len(memory_items)} memory item(s)")
+        if memory_items:
+            item = memory_items[0]
+            print(f"     - Memory: {item.memory[:60]}...")
+            print(f"     - Type: {item.metadata.memory_type}")
@@ -31,12 +31,16 @@ class AssistantParserDemo(BaseParserDemo):
 
         info = {"user_id": "user1", "session_id": "session1"}
 
+        # Parse every message up front so all memories are embedded in one batch
+        messages = [msg for case in ASSISTANT_MESSAGE_CASES for msg in case.scene_data]
+        parsed = iter(self.parse_fast_batch(messages, info))
+
         for case in ASSISTANT_MESSAGE_CASES:
             print(f"\n--- Case: {case.description} ---")
             for msg in case.scene_data:
                 source = self.demo_source_creation(msg, info)
                 self.demo_rebuild(source)
-                self.demo_parse_fast(msg, info)
+                self.demo_parse_fast(msg, info, parsed=next(parsed))
 
 
 if __name__ == "__main__":
@@ -10,30 +10,42 @@ class SystemParserDemo(BaseParserDemo):
     def create_parser(self):
         return SystemParser(embedder=self.embedder, llm=self.llm)
 
+    @staticmethod
+    def flatten_content(msg: dict) -> dict:
+        """Merge list content into a single text string.
+
+        Workaround: SystemParser in src only supports str/dict content, not list.
+        Since we cannot modify src, we flatten list content here.
+        """
+        if not isinstance(msg.get("content"), list):
+            return msg
+        msg_to_process = msg.copy()
+        msg_to_process["content"] = "".join(
+            part.get("text", "")
+            for part in msg["content"]
+            if isinstance(part, dict) and part.get("type") == "text"
+        )
+        return msg_to_process
+
     def run(self):
         print("=== SystemParser Demo ===")
 
         info = {"user_id": "user1", "session_id": "session1"}
 
+        # Parse every message up front so all memories are embedded in one batch
+        messages = [
+            self.flatten_content(msg) for case in SYSTEM_MESSAGE_CASES for msg in case.scene_data
+        ]
+        parsed = iter(self.parse_fast_batch(messages, info))
+        messages_iter = iter(messages)
+
         for case in SYSTEM_MESSAGE_CASES:
             print(f"\n--- Case: {case.description} ---")
-            for msg in case.scene_data:
-                # Workaround: SystemParser in src only supports str/dict content, not list.
-                # Since we cannot modify src, we flatten list content here.
-                msg_to_process = msg
-                if isinstance(msg.get("content"), list):
-                    msg_to_process = msg.copy()
-                    content_list = msg["content"]
-                    merged_text = "".join(
-                        part.get("text", "")
-                        for part in content_list
-                        if isinstance(part, dict) and part.get("type") == "text"
-                    )
-                    msg_to_process["content"] = merged_text
-
+            for _ in case.scene_data:
+                msg_to_process = next(messages_iter)
                 source = self.demo_source_creation(msg_to_process, info)
                 self.demo_rebuild(source)
-                self.demo_parse_fast(msg_to_process, info)
+                self.demo_parse_fast(msg_to_process, info, parsed=next(parsed))
 
 
 if __name__ == "__main__":
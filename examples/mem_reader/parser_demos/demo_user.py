@@ -15,6 +15,10 @@ class UserParserDemo(BaseParserDemo):
 
         info = {"user_id": "user1", "session_id": "session1"}
 
+        # Parse every message up front so all memories are embedded in one batch
+        messages = [msg for case in USER_MESSAGE_CASES for msg in case.scene_data]
+        parsed = iter(self.parse_fast_batch(messages, info))
+
         for case in USER_MESSAGE_CASES:
             print(f"\n--- Case: {case.description} ---")
             for msg in case.scene_data:
@@ -35,7 +39,7 @@ class UserParserDemo(BaseParserDemo):
                 else:
                     self.demo_rebuild(sources)
 
-                self.demo_parse_fast(msg, info)
+                self.demo_parse_fast(msg, info, parsed=next(parsed))
 
 
 if __name__ == "__main__":
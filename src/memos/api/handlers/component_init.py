@@ -22,6 +22,7 @@ from memos.api.handlers.config_builders import (
     build_reranker_config,
 )
 from memos.configs.mem_scheduler import SchedulerConfigFactory
+from memos.context.context import ContextThreadPoolExecutor
 from memos.embedders.factory import EmbedderFactory
 from memos.graph_dbs.factory import GraphStoreFactory
 from memos.llms.factory import LLMFactory
@@ -162,14 +163,20 @@ def init_server() -> dict[str, Any]:
     logger.debug("Component configurations built successfully")
 
     # Create component instances
-    graph_db = GraphStoreFactory.from_config(graph_db_config)
-    llm = LLMFactory.from_config(llm_config)
+    # The graph DB, LLM and embedder are independent and mostly wait on network handshakes
+    # or model loading, so build them concurrently
+    with ContextThreadPoolExecutor(max_workers=3, thread_name_prefix="init") as executor:
+        graph_db_future = executor.submit(GraphStoreFactory.from_config, graph_db_config)
+        llm_future = executor.submit(LLMFactory.from_config, llm_config)
+        embedder_future = executor.submit(EmbedderFactory.from_config, embedder_config)
+        graph_db = graph_db_future.result()
+        llm = llm_future.result()
+        embedder = embedder_future.result()
     chat_llms = (
         _init_chat_llms(chat_llm_config)
         if os.getenv("ENABLE_CHAT_API", "false") == "true"
         else None
     )
-    embedder = EmbedderFactory.from_config(embedder_config)
     nli_client = NLIClient(base_url=nli_client_config["base_url"])
     memory_history_manager = MemoryHistoryManager(nli_client=nli_client, graph_db=graph_db)
     # Pass graph_db to mem_reader for recall operations (deduplication, conflict detection)
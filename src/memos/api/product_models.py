@@ -715,6 +715,20 @@ class APIADDRequest(BaseRequest):
         return self
 
 
+class APIADDBatchRequest(BaseRequest):
+    """Request model for adding several independent add requests in one call."""
+
+    requests: list[APIADDRequest] = Field(
+        ...,
+        max_length=100,
+        description=(
+            "Add requests processed in order (at most 100). The response `data` holds one "
+            "MemoryResponse per request, at the same index; a failed request gets an "
+            "entry with its error code and message and `data` set to None."
+        ),
+    )
+
+
 class APIFeedbackRequest(BaseRequest):
     """Request model for processing feedback info."""
 
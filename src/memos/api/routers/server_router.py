@@ -25,6 +25,7 @@ from memos.api.handlers.feedback_handler import FeedbackHandler
 from memos.api.handlers.search_handler import SearchHandler
 from memos.api.product_models import (
     AllStatusResponse,
+    APIADDBatchRequest,
     APIADDRequest,
     APIChatCompleteRequest,
     APIFeedbackRequest,
@@ -127,6 +128,37 @@ def add_memories(add_req: APIADDRequest):
     return add_handler.handle_add_memories(add_req)
 
 
+@router.post("/add_batch", summary="Add memories in batch", response_model=MemoryResponse)
+def add_memories_batch(batch_req: APIADDBatchRequest):
+    """
+    Add several independent add requests in a single round trip.
+
+    Each request is handled by the AddHandler in order; the response data holds
+    the per-request MemoryResponse at the same index as its request. A request that
+    fails gets an error entry (code, message, data=None) at its index, mapped like the
+    app's exception handlers, and does not stop the requests after it.
+    """
+    results = []
+    failed = 0
+    for index, add_req in enumerate(batch_req.requests):
+        try:
+            results.append(add_handler.handle_add_memories(add_req).model_dump())
+        except Exception as e:
+            failed += 1
+            if isinstance(e, HTTPException):
+                code, message = e.status_code, str(e.detail)
+            elif isinstance(e, ValueError):
+                code, message = 400, str(e)
+            else:
+                code, message = 500, str(e)
+            logger.error(f"add_batch request {index} failed: {e}", exc_info=code == 500)
+            results.append({"code": code, "message": message, "data": None})
+    return MemoryResponse(
+        message=f"Processed {len(results)} add requests, {failed} failed",
+        data=results,
+    )
+
+
 # =============================================================================
 # Scheduler API Endpoints
 # =============================================================================
@@ -45,6 +45,14 @@ class SenTranEmbedderConfig(BaseEmbedderConfig):
         default=True,
         description="Whether to trust remote code when loading the model",
     )
+    device: str | None = Field(
+        default=None,
+        description="Device to run the model on, e.g. 'cpu' or 'cuda'; auto-detected if not set",
+    )
+    use_fp16: bool = Field(
+        default=False,
+        description="Whether to run the model in half precision (only applied on CUDA)",
+    )
 
 
 class UniversalAPIEmbedderConfig(BaseEmbedderConfig):
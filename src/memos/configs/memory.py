@@ -54,6 +54,10 @@ class KVCacheMemoryConfig(BaseActMemoryConfig):
         default_factory=LLMConfigFactory,
         description="LLM configuration for the memory extractor",
     )
+    quantize_dump: bool = Field(
+        default=False,
+        description="Whether to store KV caches as per-head int8 tensors when dumping",
+    )
 
     @field_validator("extractor_llm")
     @classmethod
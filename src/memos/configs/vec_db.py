@@ -29,6 +29,32 @@ class QdrantVecDBConfig(BaseVecDBConfig):
     path: str | None = Field(default=None, description="Path for Qdrant")
     url: str | None = Field(default=None, description="Qdrant Cloud/remote endpoint URL")
     api_key: str | None = Field(default=None, description="Qdrant Cloud API key")
+    vector_datatype: Literal["float32", "float16"] | None = Field(
+        default=None,
+        description="Storage datatype for vectors of new collections (Qdrant default: float32)",
+    )
+    quantization: Literal["scalar", "binary"] | None = Field(
+        default=None,
+        description=(
+            "Quantize vectors of new collections (scalar: int8, binary: 1 bit per dimension); "
+            "searches then rescore the oversampled candidates with the original vectors"
+        ),
+    )
+    on_disk: bool | None = Field(
+        default=None,
+        description="Keep original vectors of new collections on disk (Qdrant default: in RAM)",
+    )
+    hnsw_config: dict[str, Any] | None = Field(
+        default=None,
+        description=(
+            "HNSW index parameters for new collections, e.g. "
+            '{"m": 16, "ef_construct": 128, "full_scan_threshold": 10000, "on_disk": false}'
+        ),
+    )
+    hnsw_ef: int | None = Field(
+        default=None,
+        description="HNSW beam size at search time; higher values trade latency for recall",
+    )
 
     @model_validator(mode="after")
     def set_default_path(self):
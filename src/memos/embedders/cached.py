@@ -0,0 +1,126 @@
+import hashlib
+import sqlite3
+import threading
+
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from memos.embedders.base import BaseEmbedder
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class CachingEmbedder(BaseEmbedder):
+    """
+    Embedder wrapper that caches vectors by text content.
+
+    Vectors are kept in an in-process LRU and, when `cache_path` is given, in a
+    SQLite file so identical texts are not re-embedded across runs. All cache
+    misses of one `embed` call are sent to the wrapped embedder in one batch.
+    """
+
+    def __init__(
+        self,
+        embedder: BaseEmbedder,
+        cache_path: str | Path | None = None,
+        max_memory_items: int = 10000,
+    ):
+        """
+        Args:
+            embedder: Embedder that generates the vectors on a cache miss.
+            cache_path: Optional SQLite file used as a persistent second cache layer.
+            max_memory_items: Maximum number of vectors kept in the in-process LRU.
+        """
+        super().__init__(embedder.config)
+        self.embedder = embedder
+        # Everything besides the text that decides the vector, so embedders with a different
+        # backend, endpoint or dimension never read each other's entries in a shared file
+        config = embedder.config
+        self._namespace = "\0".join(
+            str(part)
+            for part in (
+                f"{type(embedder).__module__}.{type(embedder).__qualname__}",
+                getattr(config, "provider", None),
+                getattr(config, "api_base", None) or getattr(config, "base_url", None),
+                config.model_name_or_path,
+                config.embedding_dims,
+                config.max_tokens,
+            )
+        )
+        self.max_memory_items = max_memory_items
+        self._memory: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if cache_path is not None:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(cache_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB)"
+            )
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self._namespace}\0{text}".encode()).digest()
+
+    def _get(self, key: bytes) -> list[float] | None:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+            return vector
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        vector = array("d", row[0]).tolist()
+        self._remember(key, vector)
+        return vector
+
+    def _remember(self, key: bytes, vector: list[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for the given texts, reusing cached vectors.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            List of embeddings in the same order as `texts`.
+        """
+        keys = [self._key(text) for text in texts]
+        with self._lock:
+            vectors = [self._get(key) for key in keys]
+
+        # Embed each distinct missing text once, in a single batched call
+        misses = {
+            key: text
+            for key, text, vector in zip(keys, texts, vectors, strict=True)
+            if vector is None
+        }
+        if misses:
+            new_vectors = dict(zip(misses, self.embedder.embed(list(misses.values())), strict=True))
+            with self._lock:
+                for key, vector in new_vectors.items():
+                    self._remember(key, vector)
+                if self._db is not None:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [
+                            (key, array("d", vector).tobytes())
+                            for key, vector in new_vectors.items()
+                        ],
+                    )
+                    self._db.commit()
+            logger.debug(f"[CachingEmbedder] {len(misses)} of {len(texts)} texts embedded")
+            vectors = [
+                vector if vector is not None else new_vectors[key]
+                for key, vector in zip(keys, vectors, strict=True)
+            ]
+        return vectors
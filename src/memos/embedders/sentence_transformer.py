@@ -16,12 +16,24 @@ class SenTranEmbedder(BaseEmbedder):
         install_link="https://www.sbert.net/docs/installation.html",
     )
     def __init__(self, config: SenTranEmbedderConfig):
+        import torch
+
         from sentence_transformers import SentenceTransformer
 
         self.config = config
+        device = self.config.device
+        if device and device.startswith("cuda") and not torch.cuda.is_available():
+            logger.warning(f"Device '{device}' requested but CUDA is not available. Using CPU.")
+            device = "cpu"
+
         self.model = SentenceTransformer(
-            self.config.model_name_or_path, trust_remote_code=self.config.trust_remote_code
+            self.config.model_name_or_path,
+            device=device,
+            trust_remote_code=self.config.trust_remote_code,
         )
+        # Half precision halves the weight and activation traffic on GPU; CPU kernels gain nothing
+        if self.config.use_fp16 and self.model.device.type == "cuda":
+            self.model.half()
 
         if self.config.embedding_dims is not None:
             logger.warning(
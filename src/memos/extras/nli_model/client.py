@@ -2,6 +2,9 @@ import logging
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
+from memos.context.context import ContextThreadPoolExecutor
 from memos.extras.nli_model.types import NLIResult
 
 
@@ -13,9 +16,14 @@ class NLIClient:
     Client for interacting with the deployed NLI model service.
     """
 
-    def __init__(self, base_url: str = "http://localhost:32532"):
+    def __init__(self, base_url: str = "http://localhost:32532", max_concurrency: int = 8):
         self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
         self.session = requests.Session()
+        # Keep enough pooled connections open for concurrent batch calls
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def compare_one_to_many(self, source: str, targets: list[str]) -> list[NLIResult]:
         """
@@ -59,3 +67,25 @@ class NLIClient:
             logger.error(f"[NLIClient] Request failed: {e}")
             # Fallback: if NLI fails, assume all are Unrelated to avoid blocking the flow.
             return [NLIResult.UNRELATED] * len(targets)
+
+    def compare_many_to_many(
+        self, sources: list[str], targets: list[list[str]]
+    ) -> list[list[NLIResult]]:
+        """
+        Compare several sources against their own target lists, sending the requests concurrently.
+
+        Args:
+            sources: The new memory contents.
+            targets: For each source, the existing memory contents to compare against.
+
+        Returns:
+            For each source, the list of NLIResult corresponding to its targets.
+        """
+        if len(sources) != len(targets):
+            raise ValueError("sources and targets must have the same length")
+        if len(sources) <= 1:
+            return [self.compare_one_to_many(s, t) for s, t in zip(sources, targets, strict=True)]
+
+        max_workers = min(self.max_concurrency, len(sources))
+        with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.compare_one_to_many, sources, targets))
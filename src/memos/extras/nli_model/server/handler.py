@@ -76,7 +76,6 @@ class NLIHandler:
         self.model.eval()
 
         self.id2label = {int(k): v for k, v in self.model.config.id2label.items()}
-        self.softmax = torch.nn.Softmax(dim=-1).to(self.device)
 
         if use_compile and hasattr(torch, "compile"):
             logger.info("Compiling model with torch.compile...")
@@ -133,16 +132,12 @@ class NLIHandler:
         inputs = self.tokenizer(
             premises, hypotheses, return_tensors="pt", truncation=True, max_length=512, padding=True
         ).to(self.device)
-        with torch.no_grad():
-            out = self.model(**inputs)
-            probs = self.softmax(out.logits)
-
-        results = []
-        for p in probs:
-            idx = int(torch.argmax(p).item())
-            res = self.id2label.get(idx, str(idx))
-            results.append(_map_label_to_result(res))
-        return results
+        with torch.inference_mode():
+            logits = self.model(**inputs).logits
+
+        # Softmax does not change the argmax; take all labels in one op and one device sync
+        label_ids = logits.argmax(dim=-1).tolist()
+        return [_map_label_to_result(self.id2label.get(idx, str(idx))) for idx in label_ids]
 
     def compare_one_to_many(self, source: str, targets: list[str]) -> list[NLIResult]:
         """
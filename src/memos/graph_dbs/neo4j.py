@@ -1612,7 +1612,8 @@ class Neo4jGraphDB(BaseGraphDB):
         Create standard B-tree indexes on memory_type, created_at,
         and updated_at fields.
         Create standard B-tree indexes on user_name when use Shared Database
-        Multi-Tenant Mode
+        Multi-Tenant Mode (queries filter on user_name there even when it is
+        only passed per call)
         """
         try:
             with self.driver.session(database=self.db_name) as session:
@@ -1634,14 +1635,14 @@ class Neo4jGraphDB(BaseGraphDB):
                 """)
                 logger.debug("Index 'memory_updated_at_index' ensured.")
 
-                if not self.config.use_multi_db and self.config.user_name:
+                if not self.config.use_multi_db:
                     session.run(
                         """
                         CREATE INDEX memory_user_name_index IF NOT EXISTS
                         FOR (n:Memory) ON (n.user_name)
                         """
                     )
-                logger.debug("Index 'memory_user_name_index' ensured.")
+                    logger.debug("Index 'memory_user_name_index' ensured.")
         except Exception as e:
             logger.warning(f"Failed to create basic property indexes: {e}")
 
@@ -166,6 +166,9 @@ class KVCacheMemory(BaseActMemory):
                         self.kv_cache_memories = {item.id: item for item in memories}
                     else:
                         self.kv_cache_memories = memories
+                    if data.get("quantized"):
+                        for item in self.kv_cache_memories.values():
+                            item.memory = _dequantize_cache(item.memory)
                 else:
                     # Reset to empty if no memories in data
                     self.kv_cache_memories = {}
@@ -192,7 +195,14 @@ class KVCacheMemory(BaseActMemory):
         os.makedirs(dir, exist_ok=True)
 
         # Prepare data to save (only memories)
-        data = {"kv_cache_memories": self.kv_cache_memories}
+        if self.config.quantize_dump:
+            memories = {
+                memory_id: item.model_copy(update={"memory": _quantize_cache(item.memory)})
+                for memory_id, item in self.kv_cache_memories.items()
+            }
+            data = {"kv_cache_memories": memories, "quantized": True}
+        else:
+            data = {"kv_cache_memories": self.kv_cache_memories}
 
         with open(file_path, "wb") as f:
             pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -255,6 +265,42 @@ class KVCacheMemory(BaseActMemory):
         return merged
 
 
+def _cache_layers(cache: DynamicCache) -> list[tuple]:
+    """Return the (key, value) tensor pair of every layer of a DynamicCache."""
+    if hasattr(cache, "layers"):
+        return [(layer.keys, layer.values) for layer in cache.layers]
+    if hasattr(cache, "key_cache"):
+        return list(zip(cache.key_cache, cache.value_cache, strict=True))
+    raise AttributeError("DynamicCache object has neither 'layers' nor 'key_cache' attributes")
+
+
+def _quantize_tensor(tensor):
+    """Symmetric int8 quantization with one scale per attention head (dim 1)."""
+    import torch
+
+    scale = tensor.abs().amax(dim=(-2, -1), keepdim=True).float() / 127
+    scale = scale.clamp(min=torch.finfo(torch.float32).tiny)
+    quantized = (tensor.float() / scale).round().clamp(-127, 127).to(torch.int8)
+    return {"data": quantized, "scale": scale, "dtype": tensor.dtype}
+
+
+def _quantize_cache(cache: DynamicCache) -> list[tuple[dict, dict]]:
+    """Convert a DynamicCache to per-layer int8 key/value tensors for dumping."""
+    return [(_quantize_tensor(k), _quantize_tensor(v)) for k, v in _cache_layers(cache)]
+
+
+def _dequantize_cache(layers: list[tuple[dict, dict]]) -> DynamicCache:
+    """Rebuild a DynamicCache from the output of `_quantize_cache`."""
+    cache = DynamicCache()
+    for layer_idx, (k, v) in enumerate(layers):
+        cache.update(
+            (k["data"].float() * k["scale"]).to(k["dtype"]),
+            (v["data"].float() * v["scale"]).to(v["dtype"]),
+            layer_idx,
+        )
+    return cache
+
+
 def move_dynamic_cache_htod(dynamic_cache: DynamicCache, device: str) -> DynamicCache:
     """
     Move DynamicCache from CPU to GPU device.
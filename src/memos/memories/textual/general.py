@@ -1,12 +1,16 @@
 import json
 import os
+import re
 
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from memos.configs.memory import GeneralTextMemoryConfig
+from memos.dependency import require_python_package
 from memos.embedders.factory import ArkEmbedder, EmbedderFactory, OllamaEmbedder
 from memos.llms.factory import AzureLLM, LLMFactory, OllamaLLM, OpenAILLM
 from memos.log import get_logger
@@ -118,24 +122,54 @@ class GeneralTextMemory(BaseTextMemory):
 
         self.vector_db.update(memory_id, vec_db_item)
 
-    def search(self, query: str, top_k: int, info=None, **kwargs) -> list[TextualMemoryItem]:
+    def search(
+        self, query: str, top_k: int, info=None, alpha: float = 1.0, **kwargs
+    ) -> list[TextualMemoryItem]:
         """Search for memories based on a query.
         Args:
             query (str): The query to search for.
             top_k (int): The number of top results to return.
+            alpha (float): Weight of vector similarity in the ranking score. Below 1.0, BM25
+                keyword relevance is blended in with weight 1 - alpha over an over-fetched
+                candidate set, so exact keyword matches are not missed by short queries.
         Returns:
             list[TextualMemoryItem]: List of matching memories.
         """
         query_vector = self._embed_one_sentence(query)
-        search_results = self.vector_db.search(query_vector, top_k)
-        search_results = sorted(  # make higher score first
-            search_results, key=lambda x: x.score, reverse=True
-        )
+        if alpha < 1.0:
+            candidates = self.vector_db.search(query_vector, top_k * 3)
+            scores = self._hybrid_scores(query, candidates, alpha) if candidates else []
+            ranked = sorted(zip(scores, candidates, strict=True), key=lambda x: x[0], reverse=True)
+            search_results = [item for _, item in ranked[:top_k]]
+        else:
+            search_results = self.vector_db.search(query_vector, top_k)
+            search_results = sorted(  # make higher score first
+                search_results, key=lambda x: x.score, reverse=True
+            )
         result_memories = [
             TextualMemoryItem(**search_item.payload) for search_item in search_results
         ]
         return result_memories
 
+    @require_python_package(import_name="rank_bm25", install_command="pip install rank_bm25")
+    def _hybrid_scores(self, query: str, candidates: list[VecDBItem], alpha: float) -> list[float]:
+        """Blend min-max normalized vector and BM25 scores of the search candidates."""
+        from rank_bm25 import BM25Okapi
+
+        def tokenize(text: str) -> list[str]:
+            return re.findall(r"\w+", text.lower())
+
+        def normalize(scores: np.ndarray) -> np.ndarray:
+            spread = np.ptp(scores)
+            return (scores - scores.min()) / spread if spread > 0 else np.zeros_like(scores)
+
+        vector_scores = normalize(np.array([item.score or 0.0 for item in candidates]))
+        docs = [tokenize(item.payload.get("memory", "")) for item in candidates]
+        if not any(docs):
+            return vector_scores.tolist()
+        keyword_scores = normalize(BM25Okapi(docs).get_scores(tokenize(query)))
+        return (alpha * vector_scores + (1 - alpha) * keyword_scores).tolist()
+
     def get(self, memory_id: str, user_name: str | None = None) -> TextualMemoryItem:
         """Get a memory by its ID."""
         result = self.vector_db.get_by_id(memory_id)
@@ -253,6 +253,11 @@ class TreeNodeTextualMemoryMetadata(TextualMemoryMetadata):
                 out.append(SourceMessage(type="doc", content=str(item)))
         return out
 
+    @property
+    def first_source(self) -> SourceMessage | None:
+        """The first origin of the memory, or None if it has no sources."""
+        return self.sources[0] if self.sources else None
+
     def __str__(self) -> str:
         """Pretty string representation of the metadata."""
         meta = self.model_dump(exclude_none=True)
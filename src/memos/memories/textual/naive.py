@@ -1,3 +1,4 @@
+import heapq
 import json
 import os
 
@@ -91,6 +92,8 @@ class NaiveTextMemory(BaseTextMemory):
 
     def add(self, memories: list[TextualMemoryItem | dict[str, Any]]) -> None:
         """Add memories."""
+        # Build the set of stored IDs once instead of rescanning the list for every new item
+        existing_ids = {m["id"] for m in self.memories}
         for m in memories:
             # Convert dict to TextualMemoryItem if needed
             memory_item = TextualMemoryItem(**m) if isinstance(m, dict) else m
@@ -98,7 +101,8 @@ class NaiveTextMemory(BaseTextMemory):
             # Convert to dictionary for storage
             memory_dict = memory_item.model_dump()
 
-            if memory_dict["id"] not in [m["id"] for m in self.memories]:
+            if memory_dict["id"] not in existing_ids:
+                existing_ids.add(memory_dict["id"])
                 self.memories.append(memory_dict)
 
     def update(self, memory_id: str, new_memory: TextualMemoryItem | dict[str, Any]) -> None:
@@ -119,13 +123,15 @@ class NaiveTextMemory(BaseTextMemory):
 
     def search(self, query: str, top_k: int, **kwargs) -> list[TextualMemoryItem]:
         """Search for memories based on a query."""
+        query_words = set(query.split())
         sims = [
-            (memory, len(set(query.split()) & set(memory["memory"].split())))
+            (memory, len(query_words.intersection(memory["memory"].split())))
             for memory in self.memories
         ]
-        sims.sort(key=lambda x: x[1], reverse=True)
+        # Select the top-k by overlap without sorting every stored memory
+        top = heapq.nlargest(top_k, sims, key=lambda x: x[1])
         # Convert search results to TextualMemoryItem objects
-        return [TextualMemoryItem(**memory) for memory, _ in sims[:top_k]]
+        return [TextualMemoryItem(**memory) for memory, _ in top]
 
     def get(self, memory_id: str, user_name: str | None = None) -> TextualMemoryItem:
         """Get a memory by its ID."""
@@ -6,8 +6,6 @@ from concurrent.futures import as_completed
 from datetime import datetime
 from typing import Any
 
-import requests
-
 from memos.context.context import ContextThreadPoolExecutor
 from memos.dependency import require_python_package
 from memos.embedders.factory import OllamaEmbedder
@@ -19,6 +17,7 @@ from memos.memories.textual.item import (
     SourceMessage,
     TextualMemoryItem,
 )
+from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import get_http_session
 
 
 logger = get_logger(__name__)
@@ -45,6 +44,7 @@ class BochaAISearchAPI:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
+        self.session = get_http_session()
 
     def search_web(
         self, query: str, summary: bool = True, freshness="noLimit", max_results=None
@@ -102,7 +102,7 @@ class BochaAISearchAPI:
     def _post(self, url: str, body: dict) -> list[dict]:
         """Send POST request and parse BochaAI search results."""
         try:
-            resp = requests.post(url, headers=self.headers, json=body)
+            resp = self.session.post(url, headers=self.headers, json=body)
             resp.raise_for_status()
             raw_data = resp.json()
 
@@ -311,10 +311,19 @@ class BochaAISearchRetriever:
         if not info:
             info = {"user_id": "", "session_id": ""}
 
+        # Fast mode embeds each result's summary; do it for all results in one batched call
+        embeddings = [None] * len(search_results)
+        if mode == "fast" and search_results:
+            embeddings = self.embedder.embed(
+                [r.get("summary", "") or r.get("snippet", "") for r in search_results]
+            )
+
         with ContextThreadPoolExecutor(max_workers=8) as executor:
             futures = [
-                executor.submit(self._process_result, r, query, parsed_goal, info, mode=mode)
-                for r in search_results
+                executor.submit(
+                    self._process_result, r, query, parsed_goal, info, mode=mode, embedding=emb
+                )
+                for r, emb in zip(search_results, embeddings, strict=True)
             ]
             for future in as_completed(futures):
                 try:
@@ -327,9 +336,20 @@ class BochaAISearchRetriever:
         return list(unique_memory_items.values())
 
     def _process_result(
-        self, result: dict, query: str, parsed_goal: str, info: dict[str, Any], mode="fast"
+        self,
+        result: dict,
+        query: str,
+        parsed_goal: str,
+        info: dict[str, Any],
+        mode="fast",
+        embedding: list[float] | None = None,
     ) -> list[TextualMemoryItem]:
-        """Process one Bocha search result into TextualMemoryItem."""
+        """
+        Process one Bocha search result into TextualMemoryItem.
+
+        In fast mode `embedding` is the precomputed embedding of the result content;
+        it is generated here when not provided.
+        """
         title = result.get("name", "")
         content = result.get("summary", "") or result.get("snippet", "")
         summary = result.get("summary", "") or result.get("snippet", "")
@@ -381,7 +401,11 @@ class BochaAISearchRetriever:
                         usage=[],
                         tags=tags,
                         key=title,
-                        embedding=self.embedder.embed([content])[0],
+                        embedding=(
+                            embedding
+                            if embedding is not None
+                            else self.embedder.embed([content])[0]
+                        ),
                         internet_info={
                             "title": title,
                             "url": url,
@@ -2,21 +2,27 @@
 
 import uuid
 
+from collections.abc import Iterator
 from datetime import datetime
 
 import requests
 
+from memos.context.context import ContextThreadPoolExecutor
 from memos.embedders.factory import OllamaEmbedder
 from memos.memories.textual.item import (
     SourceMessage,
     TextualMemoryItem,
     TreeNodeTextualMemoryMetadata,
 )
+from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import get_http_session
 
 
 class GoogleCustomSearchAPI:
     """Google Custom Search API Client"""
 
+    # Maximum number of result pages requested at the same time
+    MAX_PAGE_WORKERS = 3
+
     def __init__(
         self, api_key: str, search_engine_id: str, max_results: int = 20, num_per_request: int = 10
     ):
@@ -34,6 +40,7 @@ class GoogleCustomSearchAPI:
         self.max_results = max_results
         self.num_per_request = min(num_per_request, 10)  # Google API limits to 10
         self.base_url = "https://www.googleapis.com/customsearch/v1"
+        self.session = get_http_session()
 
     def search(self, query: str, num_results: int | None = None, start_index: int = 1) -> dict:
         """
@@ -59,13 +66,61 @@ class GoogleCustomSearchAPI:
         }
 
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"Google search request failed: {e}")
             return {}
 
+    def iter_result_pages(self, query: str, max_results: int | None = None) -> Iterator[list[dict]]:
+        """
+        Yield search result pages in order as they arrive
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results (uses config default if None)
+
+        Yields:
+            The result items of each page, stopping after the last non-empty page
+        """
+        if max_results is None:
+            max_results = self.max_results
+
+        # The API only serves results up to index 100
+        start_indices = list(range(1, min(max_results, 100) + 1, self.num_per_request))
+        if not start_indices:
+            return
+
+        # Fetch the first page alone: a short first page means there are no more
+        # results, and every further request costs search quota
+        first_page = self.search(query, start_index=start_indices[0])
+        if not first_page or "items" not in first_page:
+            return
+        yield first_page["items"]
+        if len(first_page["items"]) < self.num_per_request or len(start_indices) == 1:
+            return
+
+        # The remaining pages are independent requests, so fetch a few at a time
+        rest = start_indices[1:]
+        with ContextThreadPoolExecutor(
+            max_workers=min(len(rest), self.MAX_PAGE_WORKERS)
+        ) as executor:
+            pages = executor.map(lambda start: self.search(query, start_index=start), rest)
+            try:
+                for search_data in pages:
+                    if not search_data or "items" not in search_data:
+                        break
+
+                    yield search_data["items"]
+
+                    # Later pages are past the end of the results
+                    if len(search_data["items"]) < self.num_per_request:
+                        break
+            finally:
+                # Drop queued page requests that no worker has picked up yet
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def get_all_results(self, query: str, max_results: int | None = None) -> list[dict]:
         """
         Get all search results (with pagination)
@@ -81,26 +136,8 @@ class GoogleCustomSearchAPI:
             max_results = self.max_results
 
         all_results = []
-        start_index = 1
-
-        while len(all_results) < max_results:
-            search_data = self.search(query, start_index=start_index)
-
-            if not search_data or "items" not in search_data:
-                break
-
-            all_results.extend(search_data["items"])
-
-            # Check if there are more results
-            if len(search_data["items"]) < self.num_per_request:
-                break
-
-            start_index += self.num_per_request
-
-            # Avoid infinite loop
-            if start_index > 100:
-                break
-
+        for items in self.iter_result_pages(query, max_results=max_results):
+            all_results.extend(items)
         return all_results[:max_results]
 
 
@@ -145,23 +182,62 @@ class InternetGoogleRetriever:
         Returns:
             List of TextualMemoryItem
         """
+        return list(self.iter_retrieve_from_internet(query, top_k, parsed_goal, info))
+
+    def iter_retrieve_from_internet(
+        self, query: str, top_k: int = 10, parsed_goal=None, info=None
+    ) -> Iterator[TextualMemoryItem]:
+        """
+        Retrieve information from the internet, yielding items page by page
+
+        Each result page is embedded and yielded as soon as it arrives, while the
+        requests for the following pages are still in flight.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            parsed_goal: Parsed task goal (optional)
+            info (dict): Leave a record of memory consumption.
+
+        Yields:
+            TextualMemoryItem for each search result
+        """
         if not info:
             info = {"user_id": "", "session_id": ""}
-        # Get search results
-        search_results = self.google_api.get_all_results(query, max_results=top_k)
+
+        remaining = top_k
+        for search_results in self.google_api.iter_result_pages(query, max_results=top_k):
+            search_results = search_results[:remaining]
+            remaining -= len(search_results)
+            yield from self._convert_page(search_results, parsed_goal, info)
+            if remaining <= 0:
+                break
+
+    def _convert_page(
+        self, search_results: list[dict], parsed_goal, info: dict
+    ) -> list[TextualMemoryItem]:
+        """Convert one page of search results to TextualMemoryItem format"""
+        # Combine memory content
+        memory_contents = [
+            f"Title: {result.get('title', '')}\nSummary: {result.get('snippet', '')}\n"
+            f"Source: {result.get('link', '')}"
+            for result in search_results
+        ]
+        # Embed the whole page in one batched call
+        embeddings = self.embedder.embed(memory_contents) if memory_contents else []
 
         # Convert to TextualMemoryItem format
         memory_items = []
 
-        for _, result in enumerate(search_results):
+        for result, memory_content, embedding in zip(
+            search_results, memory_contents, embeddings, strict=True
+        ):
             # Extract basic information
             title = result.get("title", "")
             snippet = result.get("snippet", "")
             link = result.get("link", "")
             display_link = result.get("displayLink", "")
 
-            # Combine memory content
-            memory_content = f"Title: {title}\nSummary: {snippet}\nSource: {link}"
             # Create metadata
             metadata = TreeNodeTextualMemoryMetadata(
                 user_id=info.get("user_id", ""),
@@ -177,7 +253,7 @@ class InternetGoogleRetriever:
                 memory_type="LongTermMemory",  # Internet search results as working memory
                 key=title,
                 sources=[SourceMessage(type="web", url=link)] if link else [],
-                embedding=self.embedder.embed([memory_content])[0],  # Can add embedding later
+                embedding=embedding,
                 created_at=datetime.now().isoformat(),
                 usage=[],
                 background=f"Internet search result from {display_link}",
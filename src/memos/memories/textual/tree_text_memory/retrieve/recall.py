@@ -203,6 +203,9 @@ class GraphMemoryRetriever:
         - scope filters by memory_type if provided
         """
         use_fast_graph = kwargs.get("use_fast_graph", False)
+        # Build the match sets once instead of rebuilding them for every candidate node
+        goal_keys = set(parsed_goal.keys or [])
+        goal_tags = set(parsed_goal.tags or [])
 
         def process_node(node):
             meta = node.get("metadata", {})
@@ -211,12 +214,11 @@ class GraphMemoryRetriever:
 
             keep = False
             # key equals to node_key
-            if parsed_goal.keys and node_key in parsed_goal.keys:
+            if node_key in goal_keys:
                 keep = True
             # overlap tags more than 2
-            elif parsed_goal.tags:
-                node_tags_list = [tag.lower() for tag in node_tags]
-                overlap = len(set(node_tags_list) & set(parsed_goal.tags))
+            elif goal_tags:
+                overlap = len(goal_tags.intersection(tag.lower() for tag in node_tags))
                 if overlap >= 2:
                     keep = True
 
@@ -262,11 +264,11 @@ class GraphMemoryRetriever:
 
                 keep = False
                 # key equals to node_key
-                if parsed_goal.keys and node_key in parsed_goal.keys:
+                if node_key in goal_keys:
                     keep = True
                 # overlap tags more than 2
-                elif parsed_goal.tags:
-                    overlap = len(set(node_tags) & set(parsed_goal.tags))
+                elif goal_tags:
+                    overlap = len(goal_tags.intersection(node_tags))
                     if overlap >= 2:
                         keep = True
                 if keep:
@@ -1,3 +1,5 @@
+import heapq
+
 import numpy as np
 
 from memos.embedders.factory import OllamaEmbedder
@@ -97,19 +99,17 @@ class MemoryReranker:
             for sim, item in zip(similarity_scores, items_with_embeddings, strict=False)
         ]
 
-        # Step 4: Sort by weighted score
-        sorted_items = sorted(
+        # Step 4: Select the top-k by weighted score (no need to sort every candidate)
+        top_items = heapq.nlargest(
+            top_k,
             zip(items_with_embeddings, weighted_scores, strict=False),
             key=lambda pair: pair[1],
-            reverse=True,
         )
 
-        # Step 5: Return top-k items with fallback
-        top_items = sorted_items[:top_k]
-
+        # Step 5: Fill up with the remaining items as fallback
         if len(top_items) < top_k:
-            selected_items = [item for item, _ in top_items]
-            remaining = [(item, -1.0) for item in graph_results if item not in selected_items]
+            selected_ids = {item.id for item, _ in top_items}
+            remaining = [(item, -1.0) for item in graph_results if item.id not in selected_ids]
             top_items.extend(remaining[: top_k - len(top_items)])
 
         return top_items  # list of (item, score)
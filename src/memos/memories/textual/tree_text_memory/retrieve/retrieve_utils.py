@@ -1,3 +1,4 @@
+import functools
 import json
 import re
 
@@ -5,6 +6,9 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
+import requests
+
+from requests.adapters import HTTPAdapter
 
 from memos.dependency import require_python_package
 from memos.log import get_logger
@@ -83,6 +87,22 @@ def parse_structured_output(content: str) -> dict[str, str | list[str]]:
     return result
 
 
+@functools.cache
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session shared by the internet search clients.
+
+    Reusing one pooled session keeps connections to the search APIs alive across
+    requests and retriever instances instead of opening a new TCP/TLS connection
+    for every search call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def find_project_root(marker=".git"):
     """Find the project root directory by marking the file"""
     current = Path(__file__).resolve()
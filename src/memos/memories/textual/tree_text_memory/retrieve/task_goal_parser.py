@@ -1,5 +1,9 @@
+import copy
+import hashlib
+import threading
 import traceback
 
+from collections import OrderedDict
 from string import Template
 
 from memos.llms.base import BaseLLM
@@ -9,7 +13,10 @@ from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import (
     FastTokenizer,
     parse_json_result,
 )
-from memos.memories.textual.tree_text_memory.retrieve.utils import TASK_PARSE_PROMPT
+from memos.memories.textual.tree_text_memory.retrieve.utils import (
+    TASK_PARSE_SYSTEM_PROMPT,
+    TASK_PARSE_USER_PROMPT,
+)
 
 
 logger = get_logger(__name__)
@@ -26,6 +33,10 @@ class TaskGoalParser:
         self.llm = llm
         self.tokenizer = FastTokenizer()
         self.retries = 1
+        # LRU of fine-mode results keyed by the hash of the full LLM prompt
+        self.cache_size = 1024
+        self._cache: OrderedDict[str, ParsedTaskGoal] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def parse(
         self,
@@ -93,13 +104,32 @@ class TaskGoalParser:
                 )
             else:
                 conversation_prompt = ""
-            prompt = Template(TASK_PARSE_PROMPT).substitute(
+            prompt = Template(TASK_PARSE_USER_PROMPT).substitute(
                 task=query.strip(), context=context, conversation=conversation_prompt
             )
+            cache_key = hashlib.sha256(prompt.encode()).hexdigest()
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.info("Parsing Goal... reusing cached result for identical input")
+                return copy.deepcopy(cached)
+
             logger.info(f"Parsing Goal... LLM input is {prompt}")
-            response = self.llm.generate(messages=[{"role": "user", "content": prompt}])
+            response = self.llm.generate(
+                messages=[
+                    {"role": "system", "content": TASK_PARSE_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ]
+            )
             logger.info(f"Parsing Goal... LLM Response is {response}")
-            return self._parse_response(response, context=context)
+            parsed_goal = self._parse_response(response, context=context)
+            with self._cache_lock:
+                self._cache[cache_key] = copy.deepcopy(parsed_goal)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return parsed_goal
         except Exception:
             logger.warning(f"Fail to fine-parse query {query}: {traceback.format_exc()}")
             return self._parse_fast(query, context=context)
@@ -1,5 +1,7 @@
 # Prompt for task parsing
-TASK_PARSE_PROMPT = """
+# The task parse prompt is split into a fixed system message and a small per-query user
+# message, so backends with prefix caching can reuse the instructions across queries.
+TASK_PARSE_SYSTEM_PROMPT = """
 You are a task parsing expert. Given a user task instruction, optional former conversation and optional related memory context,extract the following structured information:
 1. Keys: the high-level keywords directly relevant to the user’s task.
 2. Tags: thematic tags to help categorize and retrieve related memories.
@@ -8,17 +10,6 @@ You are a task parsing expert. Given a user task instruction, optional former co
 5. Need for internet search: If the user's task instruction only involves objective facts or can be completed without introducing external knowledge, set "internet_search" to False. Otherwise, set it to True.
 6. Memories: Provide 2–5 short semantic expansions or rephrasings of the rephrased/original user task instruction. These are used for improved embedding search coverage. Each should be clear, concise, and meaningful for retrieval.
 
-Former conversation (if any):
-\"\"\"
-$conversation
-\"\"\"
-
-Task description(User Question):
-\"\"\"$task\"\"\"
-
-Context (if any):
-\"\"\"$context\"\"\"
-
 Return strictly in this JSON format, note that the
 keys/tags/rephrased_instruction/memories should use the same language as the
 input query:
@@ -32,6 +23,19 @@ input query:
 }
 """
 
+TASK_PARSE_USER_PROMPT = """
+Former conversation (if any):
+\"\"\"
+$conversation
+\"\"\"
+
+Task description(User Question):
+\"\"\"$task\"\"\"
+
+Context (if any):
+\"\"\"$context\"\"\"
+"""
+
 
 REASON_PROMPT = """
 You are a reasoning agent working with a memory system. You will synthesize knowledge from multiple memory cards to construct a meaningful response to the task below.
@@ -6,8 +6,6 @@ import uuid
 from concurrent.futures import as_completed
 from datetime import datetime
 
-import requests
-
 from memos.context.context import ContextThreadPoolExecutor
 from memos.embedders.factory import OllamaEmbedder
 from memos.log import get_logger
@@ -17,6 +15,7 @@ from memos.memories.textual.item import (
     SourceMessage,
     TextualMemoryItem,
 )
+from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import get_http_session
 
 
 logger = get_logger(__name__)
@@ -47,6 +46,7 @@ class XinyuSearchAPI:
             "Connection": "keep-alive",
             "token": access_key,
         }
+        self.session = get_http_session()
 
     def query_detail(self, body: dict | None = None, detail: bool = True) -> list[dict]:
         """
@@ -64,7 +64,7 @@ class XinyuSearchAPI:
             url = self.config["url"]
 
             params = json.dumps(body)
-            resp = requests.request("POST", url, headers=self.headers, data=params)
+            resp = self.session.post(url, headers=self.headers, data=params)
             res = json.loads(resp.text)["results"]
 
             # If detail interface, return online part
@@ -155,10 +155,23 @@ class XinyuSearchRetriever:
         # Convert to TextualMemoryItem format
         memory_items: list[TextualMemoryItem] = []
 
+        # Fast mode embeds each result's content; do it for all results in one batched call
+        embeddings = [None] * len(search_results)
+        if mode == "fast" and search_results:
+            embeddings = self.embedder.embed([r.get("content", "") for r in search_results])
+
         with ContextThreadPoolExecutor(max_workers=8) as executor:
             futures = [
-                executor.submit(self._process_result, result, query, parsed_goal, info, mode=mode)
-                for result in search_results
+                executor.submit(
+                    self._process_result,
+                    result,
+                    query,
+                    parsed_goal,
+                    info,
+                    mode=mode,
+                    embedding=emb,
+                )
+                for result, emb in zip(search_results, embeddings, strict=True)
             ]
             for future in as_completed(futures):
                 try:
@@ -307,7 +320,13 @@ class XinyuSearchRetriever:
         return list(set(tags))[:15]  # Limit to 15 tags
 
     def _process_result(
-        self, result: dict, query: str, parsed_goal: str, info: None, mode="fast"
+        self,
+        result: dict,
+        query: str,
+        parsed_goal: str,
+        info: None,
+        mode="fast",
+        embedding: list[float] | None = None,
     ) -> list[TextualMemoryItem]:
         if not info:
             info = {"user_id": "", "session_id": ""}
@@ -353,7 +372,11 @@ class XinyuSearchRetriever:
                         background="",
                         confidence=0.99,
                         usage=[],
-                        embedding=self.embedder.embed([content])[0],
+                        embedding=(
+                            embedding
+                            if embedding is not None
+                            else self.embedder.embed([content])[0]
+                        ),
                         internet_info={
                             "title": title,
                             "url": url,
@@ -22,9 +22,14 @@ except Exception:
 logger = get_logger(__name__)
 
 
-def _cosine_one_to_many(q: list[float], m: list[list[float]]) -> list[float]:
+def _cosine_one_to_many(
+    q: list[float], m: list[list[float]], pre_normalized: bool = False
+) -> list[float]:
     """
     Compute cosine similarities between a single vector q and a matrix m (rows are candidates).
+
+    With ``pre_normalized=True`` the rows of m are assumed to be unit length, so only the
+    query norm is needed and the per-candidate norms are skipped.
     """
     if not _HAS_NUMPY:
 
@@ -37,15 +42,17 @@ def _cosine_one_to_many(q: list[float], m: list[list[float]]) -> list[float]:
         qn = norm(q) or 1e-10
         sims = []
         for v in m:
-            vn = norm(v) or 1e-10
+            vn = 1.0 if pre_normalized else (norm(v) or 1e-10)
             sims.append(dot(q, v) / (qn * vn))
         return sims
 
     qv = _np.asarray(q, dtype=float)  # lowercase
     mv = _np.asarray(m, dtype=float)  # lowercase
     qn = _np.linalg.norm(qv) or 1e-10
-    mn = _np.linalg.norm(mv, axis=1)  # lowercase
     dots = mv @ qv
+    if pre_normalized:
+        return (dots / qn).tolist()
+    mn = _np.linalg.norm(mv, axis=1)  # lowercase
     return (dots / (mn * qn + 1e-10)).tolist()
 
 
@@ -54,10 +61,13 @@ class CosineLocalReranker(BaseReranker):
         self,
         level_weights: dict[str, float] | None = None,
         level_field: str = "background",
+        pre_normalized: bool = False,
         **kwargs,
     ):
         self.level_weights = level_weights or {"topic": 1.0, "concept": 1.0, "fact": 1.0}
         self.level_field = level_field
+        # Set when stored embeddings are unit length (e.g. bge-m3 / OpenAI embeddings)
+        self.pre_normalized = pre_normalized
 
     @timed
     def rerank(
@@ -83,7 +93,7 @@ class CosineLocalReranker(BaseReranker):
             return [(item, 0.5) for item in graph_results[:top_k]]
 
         cand_vecs = [it.metadata.embedding for it in items_with_emb]
-        sims = _cosine_one_to_many(query_embedding, cand_vecs)
+        sims = _cosine_one_to_many(query_embedding, cand_vecs, pre_normalized=self.pre_normalized)
 
         def get_weight(it: TextualMemoryItem) -> float:
             level = getattr(it.metadata, self.level_field, None)
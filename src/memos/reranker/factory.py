@@ -52,6 +52,7 @@ class RerankerFactory:
             return CosineLocalReranker(
                 level_weights=c.get("level_weights"),
                 level_field=c.get("level_field", "background"),
+                pre_normalized=c.get("pre_normalized", False),
             )
 
         if backend in {"noop", "none", "disabled"}:
@@ -1,4 +1,7 @@
-from typing import Any
+import threading
+
+from typing import Any, ClassVar
+from weakref import WeakValueDictionary
 
 from memos.configs.vec_db import QdrantVecDBConfig
 from memos.dependency import require_python_package
@@ -9,10 +12,35 @@ from memos.vec_dbs.item import VecDBItem
 
 logger = get_logger(__name__)
 
+# Clients shared by every QdrantVecDB that connects to the same server or storage path.
+# Entries drop out once no collection holds a reference to the client.
+_shared_clients: WeakValueDictionary = WeakValueDictionary()
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(client_cls: type, client_kwargs: dict[str, Any]) -> Any:
+    """Return a client for ``client_kwargs``, reusing one already open in this process.
+
+    In-memory storage is never shared, since each ``:memory:`` client is its own database.
+    """
+    if client_kwargs.get("path") == ":memory:":
+        return client_cls(**client_kwargs)
+
+    key = (client_cls, tuple(sorted(client_kwargs.items())))
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = client_cls(**client_kwargs)
+            _shared_clients[key] = client
+        return client
+
 
 class QdrantVecDB(BaseVecDB):
     """Qdrant vector database implementation."""
 
+    # Candidates fetched per result with quantized vectors before rescoring with the originals
+    _quantization_oversampling: ClassVar[dict[str, float]] = {"scalar": 2.0, "binary": 4.0}
+
     @require_python_package(
         import_name="qdrant_client",
         install_command="pip install qdrant-client",
@@ -54,7 +82,7 @@ class QdrantVecDB(BaseVecDB):
                     "(e.g., via Docker: https://qdrant.tech/documentation/quickstart/)."
                 )
 
-        self.client = QdrantClient(**client_kwargs)
+        self.client = _get_shared_client(QdrantClient, client_kwargs)
         self.create_collection()
         # Ensure common payload indexes exist (idempotent)
         try:
@@ -88,7 +116,19 @@ class QdrantVecDB(BaseVecDB):
                 vectors_config=models.VectorParams(
                     size=self.config.vector_dimension,
                     distance=distance_map[self.config.distance_metric],
+                    datatype=(
+                        models.Datatype(self.config.vector_datatype)
+                        if self.config.vector_datatype
+                        else None
+                    ),
+                    on_disk=self.config.on_disk,
                 ),
+                hnsw_config=(
+                    models.HnswConfigDiff(**self.config.hnsw_config)
+                    if self.config.hnsw_config
+                    else None
+                ),
+                quantization_config=self._quantization_config(),
             )
         except UnexpectedResponse as err:
             # Cloud Qdrant returns 409 when the collection already exists; tolerate and continue.
@@ -106,6 +146,22 @@ class QdrantVecDB(BaseVecDB):
             f"Collection '{self.config.collection_name}' created with {self.config.vector_dimension} dimensions."
         )
 
+    def _quantization_config(self) -> Any:
+        """Build the Qdrant quantization config for new collections, if any."""
+        from qdrant_client.http import models
+
+        if self.config.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        if self.config.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
+
     def list_collections(self) -> list[str]:
         """List all collections."""
         collections = self.client.get_collections()
@@ -137,12 +193,29 @@ class QdrantVecDB(BaseVecDB):
         Returns:
             List of search results with distance scores and payloads.
         """
+        from qdrant_client.http import models
+
         qdrant_filter = self._dict_to_filter(filter) if filter else None
+        search_params = None
+        if self.config.quantization or self.config.hnsw_ef:
+            search_params = models.SearchParams(
+                hnsw_ef=self.config.hnsw_ef,
+                quantization=(
+                    models.QuantizationSearchParams(
+                        ignore=False,
+                        rescore=True,
+                        oversampling=self._quantization_oversampling[self.config.quantization],
+                    )
+                    if self.config.quantization
+                    else None
+                ),
+            )
         response = self.client.query_points(
             collection_name=self.config.collection_name,
             query=query_vector,
             limit=top_k,
             query_filter=qdrant_filter,
+            search_params=search_params,
             with_vectors=True,
             with_payload=True,
         ).points
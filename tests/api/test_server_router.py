@@ -230,6 +230,70 @@ class TestServerRouterAdd:
         assert isinstance(data["data"], list)
 
 
+class TestServerRouterAddBatch:
+    """Test /add_batch endpoint input/output format."""
+
+    def test_add_batch_dispatches_each_request_in_order(self, mock_handlers, client):
+        """Test add_batch endpoint calls the add handler once per request, in order."""
+        request_data = {
+            "requests": [
+                {"user_id": "user_a", "writable_cube_ids": ["cube_a"], "messages": "first"},
+                {"user_id": "user_b", "writable_cube_ids": ["cube_b"], "messages": "second"},
+            ]
+        }
+
+        response = client.post("/product/add_batch", json=request_data)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["code"] == 200
+        assert isinstance(data["data"], list)
+        assert len(data["data"]) == 2
+        assert data["data"][0]["message"] == "Memory added successfully"
+
+        calls = mock_handlers["add"].handle_add_memories.call_args_list
+        assert len(calls) == 2
+        assert all(isinstance(call[0][0], APIADDRequest) for call in calls)
+        assert [call[0][0].user_id for call in calls] == ["user_a", "user_b"]
+
+    def test_add_batch_reports_failed_request_at_its_index(self, mock_handlers, client):
+        """Test a failing request gets an error entry while the others are still added."""
+        add_handler = mock_handlers["add"].handle_add_memories
+        success = add_handler.return_value
+        add_handler.side_effect = [success, RuntimeError("store down"), success]
+        request_data = {
+            "requests": [
+                {"user_id": f"user_{i}", "writable_cube_ids": ["cube"], "messages": "m"}
+                for i in range(3)
+            ]
+        }
+
+        response = client.post("/product/add_batch", json=request_data)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [entry["code"] for entry in data] == [200, 500, 200]
+        assert data[1]["message"] == "store down"
+        assert data[1]["data"] is None
+        assert add_handler.call_count == 3
+
+    def test_add_batch_rejects_too_many_requests(self, mock_handlers, client):
+        """Test add_batch endpoint caps the number of requests per call."""
+        request_data = {
+            "requests": [{"user_id": "user", "writable_cube_ids": ["cube"], "messages": "m"}] * 101
+        }
+
+        response = client.post("/product/add_batch", json=request_data)
+
+        assert response.status_code == 422
+
+    def test_add_batch_invalid_input_missing_requests(self, mock_handlers, client):
+        """Test add_batch endpoint with missing required field."""
+        response = client.post("/product/add_batch", json={})
+
+        assert response.status_code == 422
+
+
 class TestServerRouterChatComplete:
     """Test /chat/complete endpoint input/output format."""
 
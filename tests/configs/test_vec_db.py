@@ -48,6 +48,11 @@ def test_qdrant_vec_db_config():
             "path",
             "url",
             "api_key",
+            "vector_datatype",
+            "quantization",
+            "on_disk",
+            "hnsw_config",
+            "hnsw_ef",
         ],
     )
 
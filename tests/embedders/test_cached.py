@@ -0,0 +1,64 @@
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from memos.configs.embedder import OllamaEmbedderConfig
+from memos.embedders.cached import CachingEmbedder
+
+
+def _mock_embedder(api_base: str = "http://localhost:11434"):
+    embedder = MagicMock()
+    embedder.config = OllamaEmbedderConfig(model_name_or_path="mock-model", api_base=api_base)
+    embedder.embed.side_effect = lambda texts: [[float(len(text)), 0.5] for text in texts]
+    return embedder
+
+
+class TestCachingEmbedder(unittest.TestCase):
+    def test_embeds_only_distinct_misses_in_one_call(self):
+        """Cached texts are not re-embedded and misses go out in one batch."""
+        inner = _mock_embedder()
+        embedder = CachingEmbedder(inner)
+
+        embedder.embed(["a"])
+        result = embedder.embed(["a", "bb", "bb", "ccc"])
+
+        self.assertEqual(result, [[1.0, 0.5], [2.0, 0.5], [2.0, 0.5], [3.0, 0.5]])
+        self.assertEqual(inner.embed.call_count, 2)
+        inner.embed.assert_called_with(["bb", "ccc"])
+
+    def test_memory_cache_is_bounded(self):
+        """The least recently used vector is evicted from the in-process cache."""
+        inner = _mock_embedder()
+        embedder = CachingEmbedder(inner, max_memory_items=2)
+
+        embedder.embed(["a", "bb"])
+        embedder.embed(["ccc"])
+        embedder.embed(["a"])
+
+        self.assertEqual(inner.embed.call_count, 3)
+        inner.embed.assert_called_with(["a"])
+
+    def test_disk_cache_survives_new_instance(self):
+        """Vectors written to the SQLite cache are reused by a new wrapper."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = Path(tmp_dir) / "cache" / "embeddings.sqlite3"
+            CachingEmbedder(_mock_embedder(), cache_path=cache_path).embed(["a", "bb"])
+
+            inner = _mock_embedder()
+            result = CachingEmbedder(inner, cache_path=cache_path).embed(["bb", "a"])
+
+            self.assertEqual(result, [[2.0, 0.5], [1.0, 0.5]])
+            inner.embed.assert_not_called()
+
+    def test_disk_cache_is_not_shared_across_endpoints(self):
+        """Embedders with the same model name but another endpoint do not share vectors."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = Path(tmp_dir) / "embeddings.sqlite3"
+            CachingEmbedder(_mock_embedder(), cache_path=cache_path).embed(["a"])
+
+            inner = _mock_embedder(api_base="http://other-host:11434")
+            CachingEmbedder(inner, cache_path=cache_path).embed(["a"])
+
+            inner.embed.assert_called_once_with(["a"])
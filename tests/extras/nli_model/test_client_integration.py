@@ -101,6 +101,17 @@ class TestNLIClientIntegration(unittest.TestCase):
         self.assertEqual(args[0], source)
         self.assertEqual(args[1], targets)
 
+    def test_real_server_compare_many_to_many(self):
+        sources = ["I like apples.", "I like pears."]
+        targets = [["I love fruit.", "I hate apples."], ["I love fruit.", "I hate pears."]]
+
+        results = self.client.compare_many_to_many(sources, targets)
+
+        self.assertEqual(results, [[NLIResult.DUPLICATE, NLIResult.CONTRADICTION]] * 2)
+        self.assertEqual(self.mock_handler.compare_one_to_many.call_count, 2)
+        received = sorted(call.args[0] for call in self.mock_handler.compare_one_to_many.mock_calls)
+        self.assertEqual(received, sorted(sources))
+
     def test_real_server_empty_targets(self):
         source = "I like apples."
         targets = []
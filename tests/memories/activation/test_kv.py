@@ -7,7 +7,7 @@ from transformers import DynamicCache
 
 from memos.configs.memory import KVCacheMemoryConfig
 from memos.memories.activation.item import KVCacheItem
-from memos.memories.activation.kv import KVCacheMemory
+from memos.memories.activation.kv import KVCacheMemory, _cache_layers
 
 
 @pytest.fixture
@@ -16,6 +16,7 @@ def dummy_config():
     config = MagicMock(spec=KVCacheMemoryConfig)
     config.extractor_llm = MagicMock()
     config.memory_filename = "test_kv_cache.pkl"
+    config.quantize_dump = False
     return config
 
 
@@ -84,3 +85,27 @@ def test_from_textual_memory(kv_memory):
     item = kv_memory.from_textual_memory(DummyTextualMemory())
     assert isinstance(item, KVCacheItem)
     assert item.metadata["bar"] == 1
+
+
+def test_dump_and_load_quantized(kv_memory, tmp_path):
+    # Test that quantized dumps store int8 tensors and load back close to the original
+    cache = DynamicCache()
+    keys = torch.randn(1, 2, 4, 8)
+    values = torch.randn(1, 2, 4, 8)
+    cache.update(keys, values, 0)
+    item = KVCacheItem(memory=cache)
+    kv_memory.add([item])
+    kv_memory.config.quantize_dump = True
+
+    kv_memory.dump(str(tmp_path))
+    # The in-memory cache is left untouched by dumping
+    assert kv_memory.get(item.id).memory is cache
+    kv_memory.delete_all()
+    kv_memory.load(str(tmp_path))
+
+    loaded = kv_memory.get(item.id).memory
+    assert isinstance(loaded, DynamicCache)
+    loaded_keys, loaded_values = _cache_layers(loaded)[0]
+    assert loaded_keys.dtype == keys.dtype
+    assert torch.allclose(loaded_keys, keys, atol=keys.abs().max().item() / 127)
+    assert torch.allclose(loaded_values, values, atol=values.abs().max().item() / 127)
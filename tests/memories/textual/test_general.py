@@ -235,6 +235,30 @@ class TestGeneralTextMemory(unittest.TestCase):
         for item in search_results:
             self.assertIsInstance(item, TextualMemoryItem)
 
+    def test_hybrid_search_promotes_keyword_matches(self):
+        """Test that alpha < 1 blends keyword relevance into the vector ranking."""
+        self.mock_embedder.embed.return_value = [[0.4] * 5]
+        memories = [
+            ("User enjoys sunny days.", 0.95),
+            ("User likes apples.", 0.90),
+            ("User prefers tea over coffee.", 0.85),
+        ]
+        memory_ids = [str(uuid.uuid4()) for _ in memories]
+        self.mock_vector_db.search.return_value = [
+            VecDBItem(
+                id=memory_id,
+                vector=[0.1] * 5,
+                payload={"id": memory_id, "memory": memory, "metadata": {}},
+                score=score,
+            )
+            for memory_id, (memory, score) in zip(memory_ids, memories, strict=True)
+        ]
+
+        search_results = self.memory.search("apples", top_k=1, alpha=0.5)
+
+        self.mock_vector_db.search.assert_called_once_with([0.4] * 5, 3)
+        self.assertEqual([item.memory for item in search_results], ["User likes apples."])
+
     def test_get_memory_by_id(self):
         """Test retrieving a single memory by its ID."""
         memory_id = str(uuid.uuid4())
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+from memos.memories.textual.tree_text_memory.retrieve.bochasearch import BochaAISearchAPI
+from memos.memories.textual.tree_text_memory.retrieve.internet_retriever import (
+    GoogleCustomSearchAPI,
+    InternetGoogleRetriever,
+)
+from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import get_http_session
+
+
+def test_search_clients_share_one_http_session():
+    bocha = BochaAISearchAPI(api_key="key")
+    google = GoogleCustomSearchAPI(api_key="key", search_engine_id="cx")
+
+    assert bocha.session is google.session is get_http_session()
+
+
+def test_bocha_search_posts_through_shared_session(monkeypatch):
+    api = BochaAISearchAPI(api_key="key")
+    response = MagicMock()
+    response.json.return_value = {"data": {"webPages": {"value": [{"name": "a"}]}}}
+    post = MagicMock(return_value=response)
+    monkeypatch.setattr(api.session, "post", post)
+
+    results = api.search_web("query")
+
+    assert results == [{"name": "a"}]
+    post.assert_called_once()
+    assert post.call_args.args[0] == api.web_url
+
+
+def test_google_get_all_results_keeps_page_order(monkeypatch):
+    api = GoogleCustomSearchAPI(api_key="key", search_engine_id="cx", num_per_request=2)
+    pages = {
+        1: {"items": [{"n": 1}, {"n": 2}]},
+        3: {"items": [{"n": 3}]},
+        5: {"items": [{"n": 5}, {"n": 6}]},
+    }
+    monkeypatch.setattr(api, "search", lambda query, start_index: pages[start_index])
+
+    results = api.get_all_results("query", max_results=6)
+
+    # Stops after the short second page even though the third one was fetched
+    assert results == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+
+def test_google_short_first_page_makes_one_request(monkeypatch):
+    api = GoogleCustomSearchAPI(api_key="key", search_engine_id="cx", num_per_request=2)
+    search = MagicMock(return_value={"items": [{"n": 1}]})
+    monkeypatch.setattr(api, "search", search)
+
+    results = api.get_all_results("query", max_results=10)
+
+    assert results == [{"n": 1}]
+    search.assert_called_once_with("query", start_index=1)
+
+
+def test_google_retriever_embeds_each_page_in_one_call(monkeypatch):
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda texts: [[float(len(text))] for text in texts]
+    retriever = InternetGoogleRetriever(
+        api_key="key", search_engine_id="cx", embedder=embedder, num_per_request=2
+    )
+    pages = {
+        1: {"items": [{"title": "A", "snippet": "a", "link": "https://a"}, {"title": "B"}]},
+        3: {"items": [{"title": "C"}, {"title": "D"}]},
+    }
+    monkeypatch.setattr(
+        retriever.google_api, "search", lambda query, start_index: pages[start_index]
+    )
+
+    items = list(retriever.iter_retrieve_from_internet("query", top_k=3))
+
+    assert embedder.embed.call_count == 2
+    assert [len(call.args[0]) for call in embedder.embed.call_args_list] == [2, 1]
+    assert [item.metadata.key for item in items] == ["A", "B", "C"]
+    assert all(item.metadata.embedding for item in items)
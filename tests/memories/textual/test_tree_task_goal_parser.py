@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from memos.memories.textual.tree_text_memory.retrieve.retrieval_mid_structs import ParsedTaskGoal
@@ -35,6 +37,20 @@ def test_parse_fine_calls_llm_and_parses():
     assert result.goal_type == "fact"
 
 
+def test_parse_fine_reuses_result_for_identical_input():
+    mock_llm = MockLLM()
+    mock_llm.generate = MagicMock(wraps=mock_llm.generate)
+    parser = TaskGoalParser(llm=mock_llm)
+
+    first = parser.parse("Tell me about cats", mode="fine")
+    first.keys.append("mutated")
+    second = parser.parse("Tell me about cats", mode="fine")
+    parser.parse("Tell me about dogs", mode="fine")
+
+    assert mock_llm.generate.call_count == 2
+    assert second.keys == ["cats"]
+
+
 def test_parse_response_invalid_json():
     parser = TaskGoalParser(llm=MockLLM())
 
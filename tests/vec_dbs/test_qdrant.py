@@ -46,6 +46,52 @@ def test_create_collection(vec_db):
     assert vec_db.config.collection_name == "test_collection"
 
 
+def test_create_collection_with_float16_vectors(config, mock_qdrant_client):
+    from qdrant_client.http import models
+
+    config.config.vector_datatype = "float16"
+    mock_qdrant_client.return_value.get_collection.side_effect = Exception("Not found")
+    vec_db = VecDBFactory.from_config(config)
+
+    vectors_config = vec_db.client.create_collection.call_args.kwargs["vectors_config"]
+    assert vectors_config.datatype == models.Datatype.FLOAT16
+
+
+def test_scalar_quantization_applies_to_collection_and_search(config, mock_qdrant_client):
+    from qdrant_client.http import models
+
+    config.config.quantization = "scalar"
+    config.config.on_disk = True
+    mock_qdrant_client.return_value.get_collection.side_effect = Exception("Not found")
+    vec_db = VecDBFactory.from_config(config)
+
+    create_kwargs = vec_db.client.create_collection.call_args.kwargs
+    assert create_kwargs["vectors_config"].on_disk is True
+    assert create_kwargs["quantization_config"].scalar.type == models.ScalarType.INT8
+
+    vec_db.client.query_points.return_value.points = []
+    vec_db.search([0.1, 0.2, 0.3, 0.4], top_k=3)
+    search_params = vec_db.client.query_points.call_args.kwargs["search_params"]
+    assert search_params.quantization.rescore is True
+    assert search_params.quantization.oversampling == 2.0
+
+
+def test_hnsw_settings_apply_to_collection_and_search(config, mock_qdrant_client):
+    config.config.hnsw_config = {"m": 32, "ef_construct": 256}
+    config.config.hnsw_ef = 128
+    mock_qdrant_client.return_value.get_collection.side_effect = Exception("Not found")
+    vec_db = VecDBFactory.from_config(config)
+
+    hnsw_config = vec_db.client.create_collection.call_args.kwargs["hnsw_config"]
+    assert (hnsw_config.m, hnsw_config.ef_construct) == (32, 256)
+
+    vec_db.client.query_points.return_value.points = []
+    vec_db.search([0.1, 0.2, 0.3, 0.4], top_k=3)
+    search_params = vec_db.client.query_points.call_args.kwargs["search_params"]
+    assert search_params.hnsw_ef == 128
+    assert search_params.quantization is None
+
+
 def test_list_collections(vec_db):
     vec_db.client.get_collections.return_value.collections = [
         type("obj", (object,), {"name": "test_collection"})
@@ -148,3 +194,27 @@ def test_qdrant_client_cloud_init():
         VecDBFactory.from_config(config)
 
         mockclient.assert_called_once_with(url="https://cloud.qdrant.example", api_key="secret-key")
+
+
+def test_collections_on_same_server_share_one_client(mock_qdrant_client):
+    mock_qdrant_client.return_value.get_collection.side_effect = Exception("Not found")
+    configs = [
+        VectorDBConfigFactory.model_validate(
+            {
+                "backend": "qdrant",
+                "config": {
+                    "collection_name": name,
+                    "vector_dimension": 3,
+                    "distance_metric": "cosine",
+                    "host": "localhost",
+                    "port": 6333,
+                },
+            }
+        )
+        for name in ("first_collection", "second_collection")
+    ]
+
+    first, second = (VecDBFactory.from_config(config) for config in configs)
+
+    mock_qdrant_client.assert_called_once_with(host="localhost", port=6333, path=None)
+    assert first.client is second.client